@@ -571,6 +571,9 @@ export class EventRepository {
    * - Added p_sources and p_sim_match_threshold for fuzzy matching
    * - Return value is now a single integer, not a table
    * 
+   * Migration 014 adds events_unmatched, so the function returns one
+   * { events_linked, events_unmatched } row.
+   * 
    * @param sources - Optional array of source names to filter events (null = all sources)
    * @param similarityThreshold - Similarity threshold for fuzzy matching (0.0-1.0, default 0.5)
    * @param context - Context string for logging (e.g., 'Wien.info Importer', 'API Process')
@@ -585,8 +588,8 @@ export class EventRepository {
       console.log(`[${context}] Calling link_events_to_venues with sources: ${sources || 'all'}, threshold: ${similarityThreshold}`);
       
       // Note: Using type assertion because RPC functions are not in the generated Supabase types
-      // The function now returns a single integer (events_linked), not a table
-      const { data: eventsLinked, error: linkError } = await (supabaseAdmin as any).rpc('link_events_to_venues', {
+      // The function returns one row of OUT parameters: { events_linked, events_unmatched }
+      const { data, error: linkError } = await (supabaseAdmin as any).rpc('link_events_to_venues', {
         p_sources: sources,
         p_sim_match_threshold: similarityThreshold
       });
@@ -596,8 +599,10 @@ export class EventRepository {
         return null;
       }
       
-      console.log(`[${context}] Linked ${eventsLinked} events to venues`);
-      return { events_linked: eventsLinked || 0 };
+      const row = Array.isArray(data) ? data[0] : data;
+      const eventsLinked = row?.events_linked || 0;
+      console.log(`[${context}] Linked ${eventsLinked} events to venues (${row?.events_unmatched || 0} unmatched)`);
+      return { events_linked: eventsLinked };
     } catch (error: any) {
       console.error(`[${context}] Exception linking events to venues:`, error);
       return null;
@@ -0,0 +1,117 @@
+-- Migration: Report unmatched events from link_events_to_venues
+-- Description: Adds an events_unmatched OUT parameter to the function from migration 005,
+--              so callers can report events whose venue could not be found without
+--              a second query. Fuzzy matches now need a similarity strictly above
+--              p_sim_match_threshold. Names are compared lowercased with whitespace
+--              runs collapsed and cities case-insensitively, the same rules as the
+--              client-side fallback in website-scrapers/link_events_to_venue.py.
+-- Created: 2026-10-15
+
+-- OUT parameters define the return type, which CREATE OR REPLACE cannot change
+DROP FUNCTION IF EXISTS link_events_to_venues(text[], real);
+
+-- Function to link events to venues with fuzzy matching
+-- This function matches events with venues based on venue name and city.
+-- It updates the venue_id field on events where:
+-- 1. The event has a custom_venue_name
+-- 2. A venue exists with matching name (exact or fuzzy) and city
+-- 3. The event's venue_id is currently NULL (not already linked)
+-- 4. Optionally filters by source (if p_sources is provided)
+-- events_unmatched counts the events (within p_sources) that are still unlinked afterwards.
+CREATE OR REPLACE FUNCTION link_events_to_venues(
+  p_sources text[] DEFAULT NULL,
+  p_sim_match_threshold real DEFAULT 0.5,
+  OUT events_linked integer,
+  OUT events_unmatched integer
+)
+RETURNS record AS $$
+DECLARE
+  v_linked_exact integer := 0;
+  v_linked_fuzzy integer := 0;
+BEGIN
+  -- Step 1: Exact matches on the normalized name (lowercased, trimmed, whitespace
+  -- runs collapsed - see normalize_venue_name) and case-insensitive city
+  WITH to_match AS (
+    SELECT e.id,
+      lower(btrim(regexp_replace(e.custom_venue_name, '\s+', ' ', 'g'))) AS norm_name,
+      lower(e.city) AS norm_city
+    FROM events e
+    WHERE (p_sources IS NULL OR e.source = ANY(p_sources))
+      AND e.venue_id IS NULL
+      AND e.custom_venue_name IS NOT NULL
+      AND trim(e.custom_venue_name) <> ''
+  ),
+  norm_venues AS (
+    SELECT v.id,
+      lower(btrim(regexp_replace(v.name, '\s+', ' ', 'g'))) AS norm_name,
+      lower(v.city) AS norm_city
+    FROM venues v
+  ),
+  exact_candidates AS (
+    SELECT t.id AS event_id, v.id AS venue_id
+    FROM to_match t
+    JOIN norm_venues v
+      ON v.norm_name = t.norm_name
+      AND v.norm_city = t.norm_city
+  )
+  UPDATE events e
+  SET venue_id = ec.venue_id
+  FROM exact_candidates ec
+  WHERE e.id = ec.event_id;
+  
+  GET DIAGNOSTICS v_linked_exact = ROW_COUNT;
+  
+  -- Step 2: Fuzzy matching - the most similar venue in the same city whose
+  -- similarity is strictly above the threshold, on the same normalized names
+  WITH to_match AS (
+    SELECT e.id,
+      lower(btrim(regexp_replace(e.custom_venue_name, '\s+', ' ', 'g'))) AS norm_name,
+      lower(e.city) AS norm_city
+    FROM events e
+    WHERE (p_sources IS NULL OR e.source = ANY(p_sources))
+      AND e.venue_id IS NULL
+      AND e.custom_venue_name IS NOT NULL
+      AND trim(e.custom_venue_name) <> ''
+  ),
+  norm_venues AS (
+    SELECT v.id,
+      lower(btrim(regexp_replace(v.name, '\s+', ' ', 'g'))) AS norm_name,
+      lower(v.city) AS norm_city
+    FROM venues v
+  ),
+  fuzzy_candidates AS (
+    SELECT DISTINCT ON (t.id)
+      t.id AS event_id,
+      v.id AS venue_id,
+      similarity(v.norm_name, t.norm_name) AS sim
+    FROM to_match t
+    JOIN norm_venues v ON v.norm_city = t.norm_city
+    WHERE similarity(v.norm_name, t.norm_name) > p_sim_match_threshold
+    ORDER BY t.id, sim DESC
+  )
+  UPDATE events e
+  SET venue_id = fc.venue_id
+  FROM fuzzy_candidates fc
+  WHERE e.id = fc.event_id;
+  
+  GET DIAGNOSTICS v_linked_fuzzy = ROW_COUNT;
+  
+  events_linked := v_linked_exact + v_linked_fuzzy;
+  
+  -- Step 3: Events that still have no venue
+  SELECT count(*) INTO events_unmatched
+  FROM events e
+  WHERE (p_sources IS NULL OR e.source = ANY(p_sources))
+    AND e.venue_id IS NULL
+    AND e.custom_venue_name IS NOT NULL
+    AND trim(e.custom_venue_name) <> '';
+  
+  RETURN;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Set search_path to ensure function can find tables in public and extensions schemas
+ALTER FUNCTION link_events_to_venues(text[], real) SET search_path =public, extensions;
+
+-- Add comment for documentation
+COMMENT ON FUNCTION link_events_to_venues(text[], real) IS 'Links events to venues by matching custom_venue_name with venue name and city. Uses exact matching first, then fuzzy matching with similarity above the threshold. Filters by source if provided. Returns the count of events linked and of events still unlinked.';
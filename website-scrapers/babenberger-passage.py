@@ -8,7 +8,7 @@ Note: Babenberger Passage website shows mainly recurring events (Thu/Fri/Sat).
 For more events, consider using external aggregators like events.at or eventfinder.at
 
 Usage:
-    python website-scrapers/babenberger-passage.py [--dry-run] [--debug]
+    python website-scrapers/babenberger-passage.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
@@ -20,7 +20,7 @@ import argparse
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 class BabenbergerPassageScraper(BaseVenueScraper):
@@ -57,18 +57,18 @@ class BabenbergerPassageScraper(BaseVenueScraper):
             items = soup.select(selector)
             if items:
                 event_items = items
-                self.log(f"Found {len(items)} items using selector: {selector}", "debug" if self.debug else "info")
+                self.log(f"Found {len(items)} items using selector: {selector}", level="debug" if self.debug else "info")
                 break
         
         self.log(f"Found {len(event_items)} potential events")
         
         if len(event_items) == 0:
-            self.log("Note: Babenberger Passage shows only recurring events (Thu/Fri/Sat)", "warning")
-            self.log("Consider using external event aggregators like events.at", "warning")
+            self.log("Note: Babenberger Passage shows only recurring events (Thu/Fri/Sat)", level="warning")
+            self.log("Consider using external event aggregators like events.at", level="warning")
         
         for idx, item in enumerate(event_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item)
             
@@ -76,7 +76,7 @@ class BabenbergerPassageScraper(BaseVenueScraper):
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
                 self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                        level="success" if status == "✓" else "warning")
         
         return events
     
@@ -136,16 +136,14 @@ class BabenbergerPassageScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Babenberger Passage events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = BabenbergerPassageScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
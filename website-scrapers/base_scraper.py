@@ -12,14 +12,25 @@ This base class handles:
 - Logging and error handling
 """
 
+import argparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from datetime import datetime, timedelta
 import json
 import sys
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 from abc import ABC, abstractmethod
 
 # Add parent directory to path
@@ -30,6 +41,42 @@ UNIFIED_PIPELINE_URL = os.getenv('UNIFIED_PIPELINE_URL')  # e.g., https://your-a
 UNIFIED_PIPELINE_SECRET = os.getenv('ADMIN_WARMUP_SECRET')
 UNIFIED_PIPELINE_AVAILABLE = bool(UNIFIED_PIPELINE_URL and UNIFIED_PIPELINE_SECRET)
 
+# BeautifulSoup tree builder - lxml is C-based and much faster than html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    print("⚠️  lxml not installed, falling back to html.parser. Install with: pip install lxml")
+    HTML_PARSER = 'html.parser'
+
+# Compressed transfer - urllib3 only decodes brotli when the brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+LOG_ICONS = {
+    "info": "ℹ",
+    "success": "✓",
+    "warning": "⚠",
+    "error": "✗",
+    "debug": "🔍"
+}
+
+# Maximum number of pages fetched concurrently by fetch_pages()
+FETCH_WORKERS = 8
+
+# Per-host politeness limits applied by fetch_html()
+HOST_MAX_CONCURRENT = 4     # requests in flight to one host
+HOST_MIN_INTERVAL = 0.1     # seconds between request starts to one host
+RATE_LIMIT_RETRIES = 3      # retries on 429/503, with exponential back-off
+RETRY_AFTER_MAX = 30        # seconds; longer Retry-After values are clamped
+CONNECT_RETRIES = 3         # retries when a pooled connection cannot be (re)established
+
+# Decoded pages kept in memory per scraper by fetch_html()
+PAGE_MEMO_SIZE = 64
+
 try:
     from supabase import create_client, Client
     SUPABASE_AVAILABLE = True
@@ -37,6 +84,20 @@ except ImportError:
     print("⚠️  supabase-py not installed. Install with: pip install supabase")
     SUPABASE_AVAILABLE = False
 
+# Optional on-disk HTTP cache (pip install requests-cache)
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+HTTP_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'where2go', 'http_cache')
+HTTP_CACHE_EXPIRE = timedelta(hours=6)  # Used when the server sends no Cache-Control
+HTTP_CACHE_DEV_EXPIRE = timedelta(hours=1)  # --dry-run: served without revalidation
+# Set to any non-empty value (the --no-cache flag of every scraper CLI does this) to always hit the network
+HTTP_CACHE_DISABLE_ENV = 'SCRAPER_NO_HTTP_CACHE'
+HTTP_CACHE_BUSY_TIMEOUT = 30_000  # ms another process may hold the sqlite write lock
+
 # Import link_events_to_venues function
 try:
     from link_events_to_venue import link_events_to_venues
@@ -45,6 +106,257 @@ except ImportError:
     LINK_EVENTS_AVAILABLE = False
 
 
+def parse_scraper_args(parser: argparse.ArgumentParser) -> argparse.Namespace:
+    """
+    Add the options shared by all scraper CLIs, parse the command line and apply them.
+    
+    --no-cache sets HTTP_CACHE_DISABLE_ENV, which bypasses both the HTTP cache
+    and the intelligent scraper's parse cache (also for scrapers run by run_all).
+    """
+    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
+    parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk HTTP and parse caches')
+    args = parser.parse_args()
+    
+    if args.no_cache:
+        os.environ[HTTP_CACHE_DISABLE_ENV] = '1'
+    return args
+
+
+_http_cache_backends: Dict[bool, 'requests_cache.SQLiteCache'] = {}
+_http_cache_lock = threading.Lock()
+
+
+def _shared_http_cache(dev_run: bool) -> 'requests_cache.SQLiteCache':
+    """
+    Return the process-wide SQLite cache backend for one cache policy.
+    
+    Scrapers running concurrently (run_all's thread pool) share a single backend,
+    so their writes go through one connection and lock instead of contending for
+    the sqlite file. WAL mode and a busy timeout cover other scraper processes.
+    requests-cache keeps the session settings on the backend, hence one per policy.
+    """
+    with _http_cache_lock:
+        backend = _http_cache_backends.get(dev_run)
+        if backend is None:
+            backend = requests_cache.SQLiteCache(
+                HTTP_CACHE_PATH,
+                wal=True,
+                busy_timeout=HTTP_CACHE_BUSY_TIMEOUT,
+            )
+            _http_cache_backends[dev_run] = backend
+        return backend
+
+
+def close_http_caches():
+    """
+    Close the shared HTTP cache backends.
+    
+    Sessions are created with autoclose=False, since closing one scraper's session
+    would otherwise close the connection other scrapers are still reading from.
+    Call this once no scraper in the process is fetching any more.
+    """
+    with _http_cache_lock:
+        for backend in _http_cache_backends.values():
+            backend.close()
+        _http_cache_backends.clear()
+
+
+@dataclass(slots=True)
+class ScrapedEvent:
+    """
+    Event extracted by a venue scraper.
+    
+    Scrapers fill the fields while parsing and hand events on as dicts via
+    to_dict(). Venue fields are only set by listing scrapers (e.g. Patroc)
+    whose events take place at other venues.
+    """
+    title: Optional[str] = None
+    date: Optional[str] = None
+    time: Optional[str] = None
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    detail_url: Optional[str] = None
+    ticket_url: Optional[str] = None
+    price: Optional[str] = None
+    artists: List[str] = field(default_factory=list)
+    venue_name: Optional[str] = None
+    venue_address: Optional[str] = None
+    social_links: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict:
+        """Convert to the event dict used by save_events(); unset fields are omitted"""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+def element_text(elem) -> str:
+    """
+    Same result as elem.get_text(strip=True), without the subtree walk when the
+    element holds a single string (the common case for titles, dates and times).
+    """
+    string = elem.string
+    return string.strip() if string is not None else elem.get_text(strip=True)
+
+
+# Capitalised names in a lineup block
+ARTIST_RE = re.compile(r'\b[A-Z][A-Za-z\s&]{2,30}\b')
+
+
+def extract_artists(text: str, limit: int = 10) -> List[str]:
+    """Capitalised names from lineup text, in order and deduplicated, at most limit of them"""
+    # Ordered dedupe; stop scanning once enough artists are found
+    artists = {}
+    for match in ARTIST_RE.finditer(text):
+        artists[match.group()] = None
+        if len(artists) == limit:
+            break
+    return list(artists)
+
+
+class PrioritySelector:
+    """
+    Ordered CSS selector fallbacks evaluated with a single subtree walk.
+    
+    Gives the same results as trying each selector in turn, but collects the
+    candidates once with the union of all selectors and then tests them against
+    each (precompiled) selector in priority order.
+    """
+    __slots__ = ('selectors', 'union')
+    
+    def __init__(self, *selectors: str):
+        self.selectors = [(selector, sv.compile(selector)) for selector in selectors]
+        self.union = sv.compile(', '.join(selectors))
+    
+    def iter_first(self, root):
+        """Yield the first match of each selector, in priority order (selectors without a match are skipped)"""
+        candidates = self.union.select(root)
+        for _, compiled in self.selectors:
+            for elem in candidates:
+                if compiled.match(elem):
+                    yield elem
+                    break
+    
+    def select_one(self, root):
+        """First match of the highest-priority selector that matches anything"""
+        return next(self.iter_first(root), None)
+    
+    def iter_groups(self, root):
+        """Yield (selector, matches) for each selector that matches, in priority order"""
+        candidates = self.union.select(root)
+        for selector, compiled in self.selectors:
+            items = [elem for elem in candidates if compiled.match(elem)]
+            if items:
+                yield selector, items
+    
+    def select(self, root) -> Tuple[Optional[str], list]:
+        """All matches of the highest-priority selector that matches anything, and that selector"""
+        return next(self.iter_groups(root), (None, []))
+
+
+# Ticket links are recognised by these keywords in the href (case-insensitive) or link text
+TICKET_KEYWORDS = ('ticket', 'karte', 'buy', 'kaufen')
+TICKET_LINK_SEL = sv.compile(', '.join(f'a[href*="{kw}" i]' for kw in TICKET_KEYWORDS))
+
+
+# German month names
+GERMAN_MONTHS = {
+    'jänner': 1, 'januar': 1, 'jan': 1,
+    'februar': 2, 'feb': 2,
+    'märz': 3, 'mär': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'mai': 5, 'may': 5,
+    'juni': 6, 'jun': 6,
+    'juli': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9, 'sept': 9,
+    'oktober': 10, 'okt': 10, 'oct': 10,
+    'november': 11, 'nov': 11,
+    'dezember': 12, 'dez': 12, 'dec': 12
+}
+
+# Date formats tried in order by parse_german_date(), compiled once.
+# Each parser maps the match groups to (year or None, month, day).
+# Quantifiers are possessive (Python 3.11+): every repeat is followed by a character
+# it cannot match, so the matches are unchanged but near-misses in long page text
+# fail without backtracking.
+DATE_PATTERNS = [
+    # DD.MM.YYYY or DD.MM.YY
+    (re.compile(r'(\d{1,2}+)\.(\d{1,2}+)\.(\d{2,4}+)'), lambda g: (
+        int(g[2]) if len(g[2]) == 4 else 2000 + int(g[2]),
+        int(g[1]),
+        int(g[0])
+    )),
+    # DD/MM/YYYY or DD/MM
+    (re.compile(r'(\d{1,2}+)/(\d{1,2}+)(?:/(\d{2,4}+))?'), lambda g: (
+        int(g[2]) if g[2] else None,
+        int(g[1]),
+        int(g[0])
+    )),
+    # DD. Month YYYY (e.g., "26. November 2025")
+    (re.compile(r'(\d{1,2}+)\.\s*+(\w++)\s++(\d{4})'), lambda g: (
+        int(g[2]),
+        GERMAN_MONTHS.get(g[1].lower(), 0),
+        int(g[0])
+    )),
+    # DD. Month (without year, e.g., "26. November" or "Mittwoch 26. November")
+    # Also handles date ranges like "26. November - 27. November 2025"
+    (re.compile(r'(\d{1,2}+)\.\s*+(\w++)(?:\s*+-\s*+\d{1,2}+\.\s*+\w++\s++(\d{4}))?'), lambda g: (
+        int(g[2]) if g[2] else None,  # Year from end of range if present
+        GERMAN_MONTHS.get(g[1].lower(), 0),
+        int(g[0])
+    )),
+]
+
+# Time formats tried in order by parse_time() (matched against lowercased text)
+TIME_PATTERNS = [
+    re.compile(r'(?:doors?|einlass|start|beginn)[:\s]++(\d{1,2}+):(\d{2})'),
+    re.compile(r'(\d{1,2}+):(\d{2})\s*+(?:uhr)?'),
+]
+
+
+# Date/time labels repeat heavily across a venue's schedule, so parse results are
+# memoized. Longer texts (e.g. whole detail pages) are parsed without caching.
+PARSE_MEMO_SIZE = 1024
+PARSE_MEMO_MAX_LEN = 100
+
+
+@lru_cache(maxsize=PARSE_MEMO_SIZE)
+def _match_german_date(date_text: str) -> Optional[Tuple[Optional[int], int, int]]:
+    """
+    (year, month, day) of the first valid date in date_text, for parse_german_date().
+    
+    year is None when the text has none; the caller infers it from the current date.
+    """
+    date_text = date_text.strip().lower()
+    for pattern, parser in DATE_PATTERNS:
+        match = pattern.search(date_text)
+        if match:
+            try:
+                year, month, day = parser(match.groups())
+                if 1 <= month <= 12 and 1 <= day <= 31 and (year is None or year >= 2020):
+                    return year, month, day
+            except:
+                continue
+    return None
+
+
+@lru_cache(maxsize=PARSE_MEMO_SIZE)
+def _match_time(text: str) -> Optional[str]:
+    """First valid HH:MM time in text, for parse_time()"""
+    text = text.lower()
+    for pattern in TIME_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            try:
+                hour = int(match.group(1))
+                minute = int(match.group(2))
+                if 0 <= hour <= 23 and 0 <= minute <= 59:
+                    return f"{hour:02d}:{minute:02d}"
+            except:
+                continue
+    return None
+
+
 class BaseVenueScraper(ABC):
     """
     Abstract base class for venue scrapers.
@@ -71,11 +383,53 @@ class BaseVenueScraper(ABC):
         self.debug = debug
         self.events = []
         
-        # Setup HTTP session
-        self.session = requests.Session()
+        # Link new events to venues at the end of run(). run_all_scrapers turns this
+        # off and links once after all venues are saved
+        self.link_after_save = True
+        
+        # Venue-derived strings shared by every event row, built once instead of per event
+        self._venue_slug = self.VENUE_NAME.lower().replace(' ', '-')
+        self._source_name = f"{self._venue_slug}-scraper"
+        
+        # Per-host request slots and next allowed start time (see fetch_html)
+        self._host_lock = threading.Lock()
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._host_next_start: Dict[str, float] = {}
+        
+        # Decoded HTML of recently fetched URLs, so a page requested twice in one run
+        # (e.g. a listing that is also a detail target) is downloaded once
+        self._page_memo: 'OrderedDict[str, str]' = OrderedDict()
+        
+        # Setup HTTP session (cached across runs when requests-cache is installed).
+        # Production runs honour Cache-Control/ETag so fresh listings are still picked up;
+        # dry-run runs ignore them so re-runs while tuning a parser stay offline.
+        # --debug alone still saves to the database, so it keeps the production policy
+        if REQUESTS_CACHE_AVAILABLE and not os.getenv(HTTP_CACHE_DISABLE_ENV):
+            self.session = requests_cache.CachedSession(
+                backend=_shared_http_cache(dry_run),
+                autoclose=False,  # the backend is shared, see close_http_caches()
+                expire_after=HTTP_CACHE_DEV_EXPIRE if dry_run else HTTP_CACHE_EXPIRE,
+                cache_control=not dry_run,
+                allowable_codes=[200],
+            )
+        else:
+            self.session = requests.Session()
+        # Full browser header set - some venue sites reject requests that only carry a User-Agent
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'de-AT,de;q=0.9,en;q=0.8',
+            'Accept-Encoding': ACCEPT_ENCODING,
         })
+        # Keep-alive pool sized for fetch_pages() so concurrent fetches to one host
+        # reuse their TLS connections instead of discarding them when the pool is full.
+        # Connection failures (e.g. a dropped keep-alive socket) are retried with back-off
+        adapter = HTTPAdapter(
+            pool_maxsize=FETCH_WORKERS,
+            max_retries=Retry(total=CONNECT_RETRIES, connect=CONNECT_RETRIES, read=0, backoff_factor=0.5),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Initialize Supabase
         self.supabase: Optional[Client] = None
@@ -88,39 +442,149 @@ class BaseVenueScraper(ABC):
         supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('NEXT_PUBLIC_SUPABASE_ANON_KEY')
         
         if not supabase_url or not supabase_key:
-            self.log("Supabase credentials not found. Running in dry-run mode.", "warning")
+            self.log("Supabase credentials not found. Running in dry-run mode.", level="warning")
             self.dry_run = True
             return
         
         try:
             self.supabase = create_client(supabase_url, supabase_key)
-            self.log("Supabase client initialized", "success")
+            self.log("Supabase client initialized", level="success")
         except Exception as e:
-            self.log(f"Failed to initialize Supabase: {e}", "warning")
+            self.log(f"Failed to initialize Supabase: {e}", level="warning")
             self.dry_run = True
     
-    def log(self, message: str, level: str = "info"):
-        """Log message with formatting"""
-        icons = {
-            "info": "ℹ",
-            "success": "✓",
-            "warning": "⚠",
-            "error": "✗",
-            "debug": "🔍"
-        }
-        icon = icons.get(level, "•")
-        print(f"{icon} {message}")
+    def log(self, message: str, *args, level: str = "info"):
+        """
+        Log message with formatting.
+        
+        printf-style args (e.g. log("Processing event %d/%d", idx, total, level="debug"))
+        are only interpolated when the message is printed; debug messages are
+        dropped unless the scraper runs with debug=True.
+        """
+        if level == "debug" and not self.debug:
+            return
+        if args:
+            message = message % args
+        print(f"{LOG_ICONS.get(level, '•')} {message}")
     
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page"""
+    def log_lines(self, lines: List[Tuple[str, str]]):
+        """Log several (message, level) pairs with a single write"""
+        if lines:
+            print('\n'.join(f"{LOG_ICONS.get(level, '•')} {message}" for message, level in lines))
+    
+    def _wait_for_host(self, host: str):
+        """Reserve the next request start for host, sleeping until it is due"""
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_start.get(host, 0.0))
+            self._host_next_start[host] = start + HOST_MIN_INTERVAL
+        if start > now:
+            time.sleep(start - now)
+    
+    def _get(self, url: str) -> requests.Response:
+        """
+        GET url within the per-host limits.
+        
+        At most HOST_MAX_CONCURRENT requests run against one host, their starts are
+        spaced by HOST_MIN_INTERVAL, and 429/503 answers are retried after the
+        server's Retry-After (or 1s, 2s, 4s; at most RETRY_AFTER_MAX) instead of
+        failing the page. The host slot is released while waiting to retry.
+        """
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            slot = self._host_slots.setdefault(host, threading.Semaphore(HOST_MAX_CONCURRENT))
+        
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            with slot:
+                self._wait_for_host(host)
+                response = self.session.get(url, timeout=30)
+            if response.status_code not in (429, 503) or attempt == RATE_LIMIT_RETRIES:
+                return response
+            # Back off without holding the host slot, so other requests can proceed
+            retry_after = response.headers.get('Retry-After', '')
+            delay = min(int(retry_after) if retry_after.isdigit() else 2 ** attempt, RETRY_AFTER_MAX)
+            if self.debug:
+                self.log(f"HTTP {response.status_code} from {host}, retrying in {delay}s", level="debug")
+            time.sleep(delay)
+    
+    def fetch_html(self, url: str) -> Optional[str]:
+        """
+        Fetch a web page and return its decoded HTML.
+        
+        The PAGE_MEMO_SIZE most recently used pages are kept in memory (LRU), so
+        repeated requests for a URL within one run are served without another
+        round trip. The HTML string is cached rather than the soup, since callers
+        may modify their trees.
+        """
+        with self._host_lock:
+            html = self._page_memo.get(url)
+            if html is not None:
+                self._page_memo.move_to_end(url)
+                return html
+        
         try:
-            response = self.session.get(url, timeout=30)
+            response = self._get(url)
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            
+            # Decode with the declared charset (UTF-8 if none) instead of response.text,
+            # which falls back to ISO-8859-1 or charset detection
+            content_type = response.headers.get('Content-Type', '')
+            charset = content_type.partition('charset=')[2].split(';')[0].strip(' "\'')
+            try:
+                html = response.content.decode(charset or 'utf-8', errors='replace')
+            except LookupError:
+                html = response.content.decode('utf-8', errors='replace')
+            
+            with self._host_lock:
+                self._page_memo[url] = html
+                if len(self._page_memo) > PAGE_MEMO_SIZE:
+                    self._page_memo.popitem(last=False)
+            return html
         except Exception as e:
-            self.log(f"Error fetching {url}: {e}", "error")
+            self.log(f"Error fetching {url}: {e}", level="error")
             return None
     
+    def parse_html(self, html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """
+        Parse HTML into a BeautifulSoup tree.
+        
+        parse_only restricts the tree to matching elements (and their
+        subtrees), which skips building nodes for the rest of the page.
+        """
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+    
+    def fetch_page(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse a web page"""
+        html = self.fetch_html(url)
+        if html is None:
+            return None
+        return self.parse_html(html, parse_only)
+    
+    def fetch_pages(self, urls: List[str], max_workers: int = FETCH_WORKERS,
+                    parse_only: Optional[SoupStrainer] = None) -> List[Optional[BeautifulSoup]]:
+        """
+        Fetch and parse several pages concurrently.
+        
+        Results are returned in the same order as urls (None for failed fetches).
+        The requests share self.session, so connections are reused.
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(lambda url: self.fetch_page(url, parse_only), urls))
+    
+    def absolute_url(self, href: str, base: Optional[str] = None) -> str:
+        """
+        Resolve a link found on a page to an absolute URL.
+        
+        Pass the URL of the page the link came from as base so relative paths
+        resolve as a browser would. Without it they resolve against BASE_URL,
+        treated as a directory (a trailing slash is added), so "events/x" under
+        https://venue.at/de becomes https://venue.at/de/events/x; root-relative
+        ("/x"), absolute and protocol-relative (//cdn...) links are handled by urljoin.
+        """
+        return urljoin(base or self.BASE_URL.rstrip('/') + '/', href)
+    
     def parse_german_date(self, date_text: str) -> Optional[str]:
         """
         Parse various German date formats to YYYY-MM-DD
@@ -135,77 +599,22 @@ class BaseVenueScraper(ABC):
         if not date_text:
             return None
         
-        date_text = date_text.strip()
-        
-        # German month names
-        months = {
-            'jänner': 1, 'januar': 1, 'jan': 1,
-            'februar': 2, 'feb': 2,
-            'märz': 3, 'mär': 3, 'mar': 3,
-            'april': 4, 'apr': 4,
-            'mai': 5, 'may': 5,
-            'juni': 6, 'jun': 6,
-            'juli': 7, 'jul': 7,
-            'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9, 'sept': 9,
-            'oktober': 10, 'okt': 10, 'oct': 10,
-            'november': 11, 'nov': 11,
-            'dezember': 12, 'dez': 12, 'dec': 12
-        }
-        
-        patterns = [
-            # DD.MM.YYYY or DD.MM.YY
-            (r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})', lambda g: (
-                int(g[2]) if len(g[2]) == 4 else 2000 + int(g[2]),
-                int(g[1]),
-                int(g[0])
-            )),
-            # DD/MM/YYYY or DD/MM
-            (r'(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?', lambda g: (
-                int(g[2]) if g[2] else None,
-                int(g[1]),
-                int(g[0])
-            )),
-            # DD. Month YYYY (e.g., "26. November 2025")
-            (r'(\d{1,2})\.\s*(\w+)\s+(\d{4})', lambda g: (
-                int(g[2]),
-                months.get(g[1].lower(), 0),
-                int(g[0])
-            )),
-            # DD. Month (without year, e.g., "26. November" or "Mittwoch 26. November")
-            # Also handles date ranges like "26. November - 27. November 2025"
-            (r'(\d{1,2})\.\s*(\w+)(?:\s*-\s*\d{1,2}\.\s*\w+\s+(\d{4}))?', lambda g: (
-                int(g[2]) if g[2] else None,  # Year from end of range if present
-                months.get(g[1].lower(), 0),
-                int(g[0])
-            )),
-        ]
-        
-        for pattern, parser in patterns:
-            match = re.search(pattern, date_text.lower())
-            if match:
-                try:
-                    groups = match.groups()
-                    year, month, day = parser(groups)
-                    
-                    # Determine year if not provided
-                    if year is None:
-                        from datetime import datetime
-                        current_year = datetime.now().year
-                        current_month = datetime.now().month
-                        
-                        # If month has passed, use next year
-                        if month < current_month:
-                            year = current_year + 1
-                        else:
-                            year = current_year
-                    
-                    if 1 <= month <= 12 and 1 <= day <= 31 and year >= 2020:
-                        return f"{year:04d}-{month:02d}-{day:02d}"
-                except:
-                    continue
+        # Plain str key, so bs4 NavigableStrings share cache entries with equal strings
+        date_text = str(date_text)
+        if len(date_text) <= PARSE_MEMO_MAX_LEN:
+            parsed = _match_german_date(date_text)
+        else:
+            parsed = _match_german_date.__wrapped__(date_text)
+        if not parsed:
+            return None
         
-        return None
+        year, month, day = parsed
+        # Determine year if not provided (not cached - it depends on the current date)
+        if year is None:
+            now = datetime.now()
+            # If month has passed, use next year
+            year = now.year + 1 if month < now.month else now.year
+        return f"{year:04d}-{month:02d}-{day:02d}"
     
     def parse_time(self, text: str) -> Optional[str]:
         """
@@ -216,23 +625,10 @@ class BaseVenueScraper(ABC):
         if not text:
             return None
         
-        time_patterns = [
-            r'(?:doors?|einlass|start|beginn)[:\s]+(\d{1,2}):(\d{2})',
-            r'(\d{1,2}):(\d{2})\s*(?:uhr)?',
-        ]
-        
-        for pattern in time_patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                try:
-                    hour = int(match.group(1))
-                    minute = int(match.group(2))
-                    if 0 <= hour <= 23 and 0 <= minute <= 59:
-                        return f"{hour:02d}:{minute:02d}"
-                except:
-                    continue
-        
-        return None
+        text = str(text)
+        if len(text) <= PARSE_MEMO_MAX_LEN:
+            return _match_time(text)
+        return _match_time.__wrapped__(text)
     
     def extract_price(self, text: str) -> Optional[str]:
         """Extract price information from text"""
@@ -287,13 +683,13 @@ class BaseVenueScraper(ABC):
         2. Direct Supabase (fallback)
         """
         if UNIFIED_PIPELINE_AVAILABLE:
-            self.log("Using Unified Pipeline API (recommended)", "info")
+            self.log("Using Unified Pipeline API (recommended)", level="info")
             return self.save_via_unified_pipeline(events)
         elif self.supabase:
-            self.log("Unified Pipeline not configured, falling back to direct Supabase", "warning")
+            self.log("Unified Pipeline not configured, falling back to direct Supabase", level="warning")
             return self.save_to_database(events)
         else:
-            self.log("No storage method available", "error")
+            self.log("No storage method available", level="error")
             return {'inserted': 0, 'updated': 0, 'errors': len(events)}
     
     def save_via_unified_pipeline(self, events: List[Dict]) -> Dict:
@@ -307,7 +703,7 @@ class BaseVenueScraper(ABC):
         - Cache synchronization with Upstash Redis
         """
         if not UNIFIED_PIPELINE_AVAILABLE:
-            self.log("Unified Pipeline not available", "error")
+            self.log("Unified Pipeline not available", level="error")
             return {'inserted': 0, 'updated': 0, 'errors': len(events)}
         
         stats = {'inserted': 0, 'updated': 0, 'errors': 0, 'venues_created': 0}
@@ -320,7 +716,7 @@ class BaseVenueScraper(ABC):
                 raw_events.append(raw_event)
         
         if not raw_events:
-            self.log("No valid events to send to pipeline", "warning")
+            self.log("No valid events to send to pipeline", level="warning")
             return stats
         
         try:
@@ -328,7 +724,7 @@ class BaseVenueScraper(ABC):
             payload = {
                 'events': raw_events,
                 'options': {
-                    'source': f"{self.VENUE_NAME.lower().replace(' ', '-')}-scraper",
+                    'source': self._source_name,
                     'city': self.CITY,
                     'dryRun': self.dry_run,
                     'debug': self.debug,
@@ -356,24 +752,24 @@ class BaseVenueScraper(ABC):
                 stats['errors'] = pipeline_result.get('eventsFailed', 0)
                 stats['venues_created'] = pipeline_result.get('venuesCreated', 0)
                 
-                self.log(f"✓ Pipeline processed {stats['inserted']} events, created {stats['venues_created']} venues", "success")
+                self.log(f"✓ Pipeline processed {stats['inserted']} events, created {stats['venues_created']} venues", level="success")
                 
                 if pipeline_result.get('errors'):
                     for error in pipeline_result['errors'][:5]:  # Show first 5 errors
-                        self.log(f"  ⚠ {error}", "warning")
+                        self.log(f"  ⚠ {error}", level="warning")
             else:
                 error_msg = response.json().get('error', response.text)
-                self.log(f"Pipeline API error ({response.status_code}): {error_msg}", "error")
+                self.log(f"Pipeline API error ({response.status_code}): {error_msg}", level="error")
                 stats['errors'] = len(raw_events)
                 
         except requests.exceptions.Timeout:
-            self.log("Pipeline API request timed out", "error")
+            self.log("Pipeline API request timed out", level="error")
             stats['errors'] = len(raw_events)
         except requests.exceptions.RequestException as e:
-            self.log(f"Pipeline API request failed: {e}", "error")
+            self.log(f"Pipeline API request failed: {e}", level="error")
             stats['errors'] = len(raw_events)
         except Exception as e:
-            self.log(f"Unexpected error calling Pipeline API: {e}", "error")
+            self.log(f"Unexpected error calling Pipeline API: {e}", level="error")
             stats['errors'] = len(raw_events)
         
         return stats
@@ -422,38 +818,81 @@ class BaseVenueScraper(ABC):
         }
     
     def save_to_database(self, events: List[Dict]) -> Dict:
-        """Save events directly to Supabase database (fallback method)"""
+        """
+        Save events directly to Supabase database (fallback method).
+        
+        Existing events are looked up by source_url in one query and new events
+        are inserted in one batch, instead of two round trips per event.
+        """
         if not self.supabase:
-            self.log("Supabase not initialized, skipping database save", "warning")
+            self.log("Supabase not initialized, skipping database save", level="warning")
             return {'inserted': 0, 'updated': 0, 'errors': 0}
         
         stats = {'inserted': 0, 'updated': 0, 'errors': 0}
         
+        prepared = []
         for event in events:
             try:
-                db_event = self._prepare_event_for_db(event)
-                
-                # Check for existing event
-                existing = None
-                if db_event.get('source_url'):
-                    result = self.supabase.table('events').select('id').eq(
-                        'source_url', db_event['source_url']
-                    ).execute()
-                    if result.data:
-                        existing = result.data[0]
-                
-                if existing:
-                    self.supabase.table('events').update(db_event).eq('id', existing['id']).execute()
-                    stats['updated'] += 1
-                    self.log(f"  ↻ Updated: {event['title'][:50]}", "info")
-                else:
-                    self.supabase.table('events').insert(db_event).execute()
-                    stats['inserted'] += 1
-                    self.log(f"  + Inserted: {event['title'][:50]}", "success")
-                    
+                prepared.append((event, self._prepare_event_for_db(event)))
+            except Exception as e:
+                stats['errors'] += 1
+                self.log(f"  Error saving {event.get('title', 'Unknown')[:50]}: {e}", level="error")
+        
+        # Check for existing events
+        source_urls = list({db_event['source_url'] for _, db_event in prepared if db_event.get('source_url')})
+        existing_ids = {}
+        if source_urls:
+            try:
+                result = self.supabase.table('events').select('id, source_url').in_(
+                    'source_url', source_urls
+                ).execute()
+                existing_ids = {row['source_url']: row['id'] for row in result.data}
+            except Exception as e:
+                self.log(f"  Error looking up existing events: {e}", level="error")
+                stats['errors'] += len(prepared)
+                return stats
+        
+        new_events = []
+        for event, db_event in prepared:
+            existing_id = existing_ids.get(db_event.get('source_url'))
+            if not existing_id:
+                new_events.append((event, db_event))
+                continue
+            
+            try:
+                self.supabase.table('events').update(db_event).eq('id', existing_id).execute()
+                stats['updated'] += 1
+                self.log(f"  ↻ Updated: {event['title'][:50]}", level="info")
             except Exception as e:
                 stats['errors'] += 1
-                self.log(f"  Error saving {event.get('title', 'Unknown')[:50]}: {e}", "error")
+                self.log(f"  Error saving {event.get('title', 'Unknown')[:50]}: {e}", level="error")
+        
+        if not new_events:
+            return stats
+        
+        # Rows sharing a source_url would all be inserted (or fail the batch); the
+        # last one wins, as it did when later duplicates became updates
+        by_url = {}
+        for event, db_event in new_events:
+            by_url[db_event.get('source_url') or id(db_event)] = (event, db_event)
+        new_events = list(by_url.values())
+        
+        try:
+            self.supabase.table('events').insert([db_event for _, db_event in new_events]).execute()
+            stats['inserted'] += len(new_events)
+            for event, _ in new_events:
+                self.log(f"  + Inserted: {event['title'][:50]}", level="success")
+        except Exception as e:
+            # A single bad row fails the whole batch - retry one by one to isolate it
+            self.log(f"  Batch insert failed, inserting individually: {e}", level="warning")
+            for event, db_event in new_events:
+                try:
+                    self.supabase.table('events').insert(db_event).execute()
+                    stats['inserted'] += 1
+                    self.log(f"  + Inserted: {event['title'][:50]}", level="success")
+                except Exception as e:
+                    stats['errors'] += 1
+                    self.log(f"  Error saving {event.get('title', 'Unknown')[:50]}: {e}", level="error")
         
         return stats
     
@@ -490,7 +929,7 @@ class BaseVenueScraper(ABC):
             'booking_url': event.get('ticket_url'),
             'image_urls': [image_url] if image_url else None,
             'tags': event.get('artists', [])[:10] if event.get('artists') else None,
-            'source': f"{self.VENUE_NAME.lower().replace(' ', '-')}-scraper",
+            'source': self._source_name,
             'source_url': event.get('detail_url') or event.get('website'),
             'slug': slug,
             'published_at': datetime.now().isoformat()
@@ -499,8 +938,7 @@ class BaseVenueScraper(ABC):
     def _generate_slug(self, title: str, date: str) -> str:
         """Generate URL-friendly slug"""
         if not title:
-            venue_slug = self.VENUE_NAME.lower().replace(' ', '-')
-            return f"{venue_slug}-{date or 'event'}"
+            return f"{self._venue_slug}-{date or 'event'}"
         
         slug = re.sub(r'[^\w\s-]', '', title.lower())
         slug = re.sub(r'[-\s]+', '-', slug).strip('-')
@@ -508,8 +946,7 @@ class BaseVenueScraper(ABC):
         if date:
             slug = f"{slug}-{date}"
         
-        venue_slug = self.VENUE_NAME.lower().replace(' ', '-')
-        slug = f"{venue_slug}-{slug}"
+        slug = f"{self._venue_slug}-{slug}"
         
         return slug[:200]
     
@@ -520,15 +957,18 @@ class BaseVenueScraper(ABC):
         print("=" * 70)
         
         if self.dry_run:
-            self.log("Running in DRY-RUN mode (no database writes)", "warning")
+            self.log("Running in DRY-RUN mode (no database writes)", level="warning")
         
         if UNIFIED_PIPELINE_AVAILABLE:
-            self.log(f"Unified Pipeline API: {UNIFIED_PIPELINE_URL}", "info")
+            self.log(f"Unified Pipeline API: {UNIFIED_PIPELINE_URL}", level="info")
         else:
-            self.log("Unified Pipeline API not configured, will use direct Supabase", "warning")
+            self.log("Unified Pipeline API not configured, will use direct Supabase", level="warning")
         
-        # Scrape events
-        events = self.scrape_events()
+        # Scrape events, then release the pooled connections (not the shared HTTP cache)
+        try:
+            events = self.scrape_events()
+        finally:
+            self.session.close()
         
         # Filter future events
         future_events = [e for e in events if self.is_future_event(e.get('date'))]
@@ -544,15 +984,16 @@ class BaseVenueScraper(ABC):
             stats = self.save_events(future_events)
             
             # Only link events to venues if using direct Supabase (not needed for pipeline)
-            if not UNIFIED_PIPELINE_AVAILABLE and stats['inserted'] > 0 and self.supabase and LINK_EVENTS_AVAILABLE:
+            if (self.link_after_save and not UNIFIED_PIPELINE_AVAILABLE and stats['inserted'] > 0
+                    and self.supabase and LINK_EVENTS_AVAILABLE):
                 print("\n" + "=" * 70)
                 print("Linking events to venues...")
                 print("=" * 70)
                 try:
                     link_stats = link_events_to_venues(self.supabase, dry_run=False, debug=self.debug)
-                    self.log(f"✓ Linked {link_stats['linked']} events to venues", "success")
+                    self.log(f"✓ Linked {link_stats['linked']} events to venues", level="success")
                 except Exception as e:
-                    self.log(f"⚠️  Error linking events to venues: {e}", "warning")
+                    self.log(f"⚠️  Error linking events to venues: {e}", level="warning")
         
         # Print summary
         print(f"\n{'=' * 70}")
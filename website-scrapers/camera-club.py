@@ -2,7 +2,7 @@
 """Camera Club Event Scraper"""
 import sys, os
 sys.path.insert(0, os.path.dirname(__file__))
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 from typing import List, Dict, Optional
 import argparse
 
@@ -27,7 +27,7 @@ class CameraClubScraper(BaseVenueScraper):
             event_data = self._parse_item(item)
             if event_data and event_data.get('title'):
                 events.append(event_data)
-                self.log(f"  ✓ {event_data['title'][:50]}", "success")
+                self.log(f"  ✓ {event_data['title'][:50]}", level="success")
         return events
     
     def _parse_item(self, item) -> Optional[Dict]:
@@ -58,9 +58,7 @@ class CameraClubScraper(BaseVenueScraper):
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('--dry-run', action='store_true')
-    parser.add_argument('--debug', action='store_true')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     scraper = CameraClubScraper(dry_run=args.dry_run, debug=args.debug)
     sys.exit(0 if scraper.run()['success'] else 1)
 
@@ -17,7 +17,7 @@ from typing import List, Dict, Optional
 import argparse
 
 sys.path.insert(0, os.path.dirname(__file__))
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 class CelesteScraper(BaseVenueScraper):
@@ -47,7 +47,7 @@ class CelesteScraper(BaseVenueScraper):
         
         for idx, row in enumerate(rows[:50], 1):  # Limit to 50
             if self.debug:
-                self.log(f"Processing event {idx}/{len(rows)}", "debug")
+                self.log(f"Processing event {idx}/{len(rows)}", level="debug")
             
             event_data = self._parse_event_row(row)
             
@@ -55,7 +55,7 @@ class CelesteScraper(BaseVenueScraper):
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
                 self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                        level="success" if status == "✓" else "warning")
         
         return events
     
@@ -101,7 +101,7 @@ class CelesteScraper(BaseVenueScraper):
                     month_int = int(month)
                     if not (1 <= day_int <= 31 and 1 <= month_int <= 12):
                         if self.debug:
-                            self.log(f"Invalid date found: day={day_int}, month={month_int} in '{date_text}'", "warning")
+                            self.log(f"Invalid date found: day={day_int}, month={month_int} in '{date_text}'", level="warning")
                         # Skip date setting for invalid dates
                     else:
                         # Determine year
@@ -155,16 +155,14 @@ class CelesteScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event row: {e}", "error")
+                self.log(f"Error parsing event row: {e}", level="error")
             return None
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Celeste events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = CelesteScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
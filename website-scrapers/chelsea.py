@@ -16,7 +16,7 @@ import argparse
 import re
 
 sys.path.insert(0, os.path.dirname(__file__))
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 class ChelseaScraper(BaseVenueScraper):
     VENUE_NAME = "Chelsea"
@@ -68,7 +68,7 @@ class ChelseaScraper(BaseVenueScraper):
                     events.append(event_data)
                     status = "✓" if event_data.get('date') else "?"
                     self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}",
-                            "success" if status == "✓" else "warning")
+                            level="success" if status == "✓" else "warning")
             
             # Also look for links to concerts in the main list
             if len(events) < 5:
@@ -76,7 +76,7 @@ class ChelseaScraper(BaseVenueScraper):
                 
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event list: {e}", "error")
+                self.log(f"Error parsing event list: {e}", level="error")
         
         return events
     
@@ -166,7 +166,7 @@ class ChelseaScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error extracting from table: {e}", "error")
+                self.log(f"Error extracting from table: {e}", level="error")
             return None
     
     def _parse_from_links(self, soup, page_url: str) -> List[Dict]:
@@ -228,15 +228,13 @@ class ChelseaScraper(BaseVenueScraper):
         
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing from links: {e}", "error")
+                self.log(f"Error parsing from links: {e}", level="error")
         
         return events
 
 def main():
     parser = argparse.ArgumentParser(description='Scrape Chelsea events')
-    parser.add_argument('--dry-run', action='store_true')
-    parser.add_argument('--debug', action='store_true')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = ChelseaScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
@@ -5,7 +5,7 @@ Extracts upcoming events from https://www.daswerk.org/programm/
 and saves them to the Supabase database.
 
 Usage:
-    python website-scrapers/das-werk.py [--dry-run] [--debug]
+    python website-scrapers/das-werk.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
@@ -19,7 +19,7 @@ import argparse
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 class DasWerkScraper(BaseVenueScraper):
@@ -54,7 +54,7 @@ class DasWerkScraper(BaseVenueScraper):
         
         for idx, item in enumerate(event_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item)
             
@@ -66,14 +66,14 @@ class DasWerkScraper(BaseVenueScraper):
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
                 self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                        level="success" if status == "✓" else "warning")
         
         return events
 
     def _upload_image_to_storage(self, image_url: str, event_title: str) -> Optional[str]:
         """Download image and upload to Supabase Storage, return public URL"""
         if not self.SUPABASE_SERVICE_KEY:
-            self.log("SUPABASE_SERVICE_KEY not set, skipping image upload", "warning")
+            self.log("SUPABASE_SERVICE_KEY not set, skipping image upload", level="warning")
             return image_url
 
         try:
@@ -98,14 +98,14 @@ class DasWerkScraper(BaseVenueScraper):
                 if upload_response.status in [200, 201]:
                     public_url = f"{self.SUPABASE_URL}/storage/v1/object/public/{self.STORAGE_BUCKET}/{filename}"
                     if self.debug:
-                        self.log(f"Uploaded image to: {public_url}", "debug")
+                        self.log(f"Uploaded image to: {public_url}", level="debug")
                     return public_url
                 else:
-                    self.log(f"Upload failed with status {upload_response.status}", "error")
+                    self.log(f"Upload failed with status {upload_response.status}", level="error")
                     return image_url
 
         except Exception as e:
-            self.log(f"Error uploading image: {e}", "error")
+            self.log(f"Error uploading image: {e}", level="error")
             return image_url  # Fallback to original URL
     
     def _parse_event_item(self, item) -> Optional[Dict]:
@@ -157,7 +157,7 @@ class DasWerkScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
 
     def _enrich_from_detail_page(self, event_data: Dict):
@@ -169,9 +169,7 @@ class DasWerkScraper(BaseVenueScraper):
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Das WERK events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = DasWerkScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
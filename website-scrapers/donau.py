@@ -10,7 +10,7 @@ from typing import List, Dict, Optional
 import argparse
 
 sys.path.insert(0, os.path.dirname(__file__))
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 class DonauScraper(BaseVenueScraper):
@@ -35,13 +35,14 @@ class DonauScraper(BaseVenueScraper):
         
         # Try common event selectors
         event_items = soup.select('article.event, div.event, article, .event-item, div[class*="event"]')
-        event_items = [item for item in event_items if item.get_text(strip=True) and len(item.get_text(strip=True)) > 20]
+        # Drop near-empty matches (one get_text walk per candidate)
+        event_items = [item for item in event_items if len(item.get_text(strip=True)) > 20]
         
         self.log(f"Found {len(event_items)} potential events")
         
         for idx, item in enumerate(event_items[:50], 1):  # Limit to 50
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item)
             
@@ -49,7 +50,7 @@ class DonauScraper(BaseVenueScraper):
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
                 self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                        level="success" if status == "✓" else "warning")
         
         return events
     
@@ -112,16 +113,14 @@ class DonauScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Donau events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = DonauScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
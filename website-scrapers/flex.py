@@ -7,7 +7,7 @@ and saves them to the Supabase database.
 Flex uses The Events Calendar WordPress plugin.
 
 Usage:
-    python website-scrapers/flex.py [--dry-run] [--debug]
+    python website-scrapers/flex.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
@@ -19,7 +19,7 @@ import argparse
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 class FlexScraper(BaseVenueScraper):
@@ -52,7 +52,7 @@ class FlexScraper(BaseVenueScraper):
         
         for idx, item in enumerate(event_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item)
             
@@ -60,7 +60,7 @@ class FlexScraper(BaseVenueScraper):
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
                 self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                        level="success" if status == "✓" else "warning")
         
         return events
     
@@ -121,16 +121,14 @@ class FlexScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Flex events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = FlexScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
@@ -7,7 +7,7 @@ Extracts upcoming events from:
 - https://flucc.at/community/ (community events)
 
 Usage:
-    python website-scrapers/flucc-wanne.py [--dry-run] [--debug]
+    python website-scrapers/flucc-wanne.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
@@ -19,7 +19,7 @@ import argparse
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 class FluccWanneScraper(BaseVenueScraper):
@@ -87,7 +87,7 @@ class FluccWanneScraper(BaseVenueScraper):
         
         for idx, link in enumerate(unique_links[:30], 1):  # Limit per page
             if self.debug:
-                self.log(f"  Processing event {idx}/{len(unique_links)}", "debug")
+                self.log(f"  Processing event {idx}/{len(unique_links)}", level="debug")
             
             event_data = self._parse_event_link(link)
             
@@ -95,7 +95,7 @@ class FluccWanneScraper(BaseVenueScraper):
                 events.append(event_data)
                 status = "✓"
                 self.log(f"    {status} {event_data['title'][:40]} - {event_data.get('date')}", 
-                        "success")
+                        level="success")
         
         return events
     
@@ -174,7 +174,7 @@ class FluccWanneScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event link: {e}", "error")
+                self.log(f"Error parsing event link: {e}", level="error")
             return None
     
     def _enrich_from_detail_page(self, event_data: Dict):
@@ -184,7 +184,7 @@ class FluccWanneScraper(BaseVenueScraper):
         
         try:
             if self.debug:
-                self.log(f"    Fetching detail page: {event_data['detail_url']}", "debug")
+                self.log(f"    Fetching detail page: {event_data['detail_url']}", level="debug")
             
             soup = self.fetch_page(event_data['detail_url'])
             if not soup:
@@ -250,15 +250,13 @@ class FluccWanneScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"    Error enriching from detail page: {e}", "warning")
+                self.log(f"    Error enriching from detail page: {e}", level="warning")
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Flucc / Flucc Wanne events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = FluccWanneScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
@@ -4,7 +4,7 @@ Generic Venue Scraper
 Uses configuration-based approach to scrape different venues.
 
 Usage:
-    python website-scrapers/generic_scraper.py <venue-key> [--dry-run] [--debug]
+    python website-scrapers/generic_scraper.py <venue-key> [--dry-run] [--debug] [--no-cache]
     
 Examples:
     python website-scrapers/generic_scraper.py flex --dry-run
@@ -23,7 +23,7 @@ import re
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 from venue_configs import get_venue_config, list_venues
 
 
@@ -60,7 +60,7 @@ class GenericVenueScraper(BaseVenueScraper):
         event_container = list_sel.get('event_container')
         
         if not event_container:
-            self.log("No event_container selector configured", "error")
+            self.log("No event_container selector configured", level="error")
             return []
         
         # Find all event items
@@ -70,7 +70,7 @@ class GenericVenueScraper(BaseVenueScraper):
         events = []
         for idx, item in enumerate(event_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item, list_sel)
             
@@ -82,7 +82,7 @@ class GenericVenueScraper(BaseVenueScraper):
                 events.append(event_data)
                 
                 status = "✓" if event_data.get('date') else "?"
-                self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", "success" if status == "✓" else "warning")
+                self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", level="success" if status == "✓" else "warning")
         
         return events
     
@@ -154,7 +154,7 @@ class GenericVenueScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
     
     def _extract_date_from_title(self, title: str) -> Optional[str]:
@@ -194,7 +194,7 @@ class GenericVenueScraper(BaseVenueScraper):
         
         try:
             if self.debug:
-                self.log(f"  Fetching detail page: {event_data['detail_url']}", "debug")
+                self.log(f"  Fetching detail page: {event_data['detail_url']}", level="debug")
             
             soup = self.fetch_page(event_data['detail_url'])
             if not soup:
@@ -244,7 +244,7 @@ class GenericVenueScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"  Error enriching from detail page: {e}", "warning")
+                self.log(f"  Error enriching from detail page: {e}", level="warning")
 
 
 def main():
@@ -263,11 +263,9 @@ Available venues:
     )
     
     parser.add_argument('venue', nargs='?', help='Venue key to scrape')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
     parser.add_argument('--list', action='store_true', help='List available venues')
     
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     # List venues if requested
     if args.list:
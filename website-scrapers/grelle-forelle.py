@@ -5,7 +5,7 @@ Extracts upcoming events from https://www.grelleforelle.com/programm/
 Now using BaseVenueScraper for unified pipeline integration.
 
 Usage:
-    python website-scrapers/grelle-forelle.py [--dry-run] [--debug]
+    python website-scrapers/grelle-forelle.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
@@ -18,7 +18,7 @@ from datetime import datetime
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 class GrelleForelleScraper(BaseVenueScraper):
@@ -46,14 +46,14 @@ class GrelleForelleScraper(BaseVenueScraper):
         
         for idx, item in enumerate(portfolio_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(portfolio_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(portfolio_items)}", level="debug")
             
             event_data = self._extract_event_from_portfolio_item(item)
             if event_data and event_data['title']:
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
                 self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                        level="success" if status == "✓" else "warning")
         
         return events
     
@@ -127,14 +127,14 @@ class GrelleForelleScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event: {e}", "error")
+                self.log(f"Error parsing event: {e}", level="error")
             return None
     
     def _enrich_from_detail_page(self, event_data: Dict):
         """Fetch detail page and enrich event data"""
         try:
             if self.debug:
-                self.log(f"  Fetching detail page: {event_data['detail_url']}", "debug")
+                self.log(f"  Fetching detail page: {event_data['detail_url']}", level="debug")
             
             soup = self.fetch_page(event_data['detail_url'])
             if not soup:
@@ -226,15 +226,13 @@ class GrelleForelleScraper(BaseVenueScraper):
                 
         except Exception as e:
             if self.debug:
-                self.log(f"  Error enriching from detail page: {e}", "warning")
+                self.log(f"  Error enriching from detail page: {e}", level="warning")
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Grelle Forelle events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = GrelleForelleScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
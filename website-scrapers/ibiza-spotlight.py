@@ -16,7 +16,7 @@ Features:
 - Deduplication: Ensures no duplicate events
 
 Usage:
-    python website-scrapers/ibiza-spotlight.py [--dry-run] [--debug]
+    python website-scrapers/ibiza-spotlight.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
@@ -30,7 +30,7 @@ from datetime import datetime, timedelta
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 # Data extraction constants
@@ -101,7 +101,7 @@ class IbizaSpotlightScraper(BaseVenueScraper):
             url = f'{self.BASE_URL}/night/events/{year}/{month}?daterange={daterange}'
             
             urls.append(url)
-            self.log(f"Window {window_num + 1}/4: {start_str} to {end_str}", "debug")
+            self.log(f"Window {window_num + 1}/4: {start_str} to {end_str}", level="debug")
         
         return urls
     
@@ -139,7 +139,7 @@ class IbizaSpotlightScraper(BaseVenueScraper):
                 soup = self.fetch_page(url)
                 if soup:
                     if attempt > 0:
-                        self.log(f"✓ Successfully fetched after {attempt} retry/ies", "success")
+                        self.log(f"✓ Successfully fetched after {attempt} retry/ies", level="success")
                     return soup
             
             except Exception as e:
@@ -148,11 +148,11 @@ class IbizaSpotlightScraper(BaseVenueScraper):
                     self.log(
                         f"Attempt {attempt + 1}/{retries} failed: {str(e)[:50]}. "
                         f"Retrying in {wait_time}s...",
-                        "warning"
+                        level="warning"
                     )
                     time.sleep(wait_time)
                 else:
-                    self.log(f"✗ Failed to fetch after {retries} attempts", "error")
+                    self.log(f"✗ Failed to fetch after {retries} attempts", level="error")
         
         return None
     
@@ -177,11 +177,11 @@ class IbizaSpotlightScraper(BaseVenueScraper):
         all_events = []
         
         for window_idx, events_url in enumerate(urls, 1):
-            self.log(f"Processing Window {window_idx}/4: {events_url}", "info")
+            self.log(f"Processing Window {window_idx}/4: {events_url}", level="info")
             
             soup = self.fetch_page_with_retry(events_url, retries=3)
             if not soup:
-                self.log(f"  ✗ Failed to fetch, skipping window", "warning")
+                self.log(f"  ✗ Failed to fetch, skipping window", level="warning")
                 continue
             
             # Find event cards on the page
@@ -210,14 +210,14 @@ class IbizaSpotlightScraper(BaseVenueScraper):
                         f"  {status} {event_data['title'][:40]} | "
                         f"{date_str:10} | "
                         f"{time_str:5}",
-                        "success" if status == "✓" else "warning"
+                        level="success" if status == "✓" else "warning"
                     )
                 
                 if card_idx < len(event_cards):
                     time.sleep(self.delay)
             
             if window_idx < len(urls):
-                self.log(f"  Waiting before next window...", "debug")
+                self.log(f"  Waiting before next window...", level="debug")
                 time.sleep(self.delay)
         
         # Deduplicate events (same date + title)
@@ -228,7 +228,7 @@ class IbizaSpotlightScraper(BaseVenueScraper):
                 unique_events[key] = event
         
         result = list(unique_events.values())
-        self.log(f"✓ Scraped {len(result)} unique events across 4 windows (30-day coverage)", "success")
+        self.log(f"✓ Scraped {len(result)} unique events across 4 windows (30-day coverage)", level="success")
         
         return result
     
@@ -354,7 +354,7 @@ class IbizaSpotlightScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event card: {e}", "error")
+                self.log(f"Error parsing event card: {e}", level="error")
             return None
     
     def _parse_iso_date(self, date_str: str) -> Optional[str]:
@@ -475,20 +475,16 @@ class IbizaSpotlightScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error enriching detail page: {e}", "warning")
+                self.log(f"Error enriching detail page: {e}", level="warning")
 
 
 def main():
     """Main entry point for the scraper"""
     parser = argparse.ArgumentParser(description='Ibiza Spotlight Event Scraper')
-    parser.add_argument('--dry-run', action='store_true', 
-                       help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true',
-                       help='Enable debug logging')
     parser.add_argument('--delay', type=float, default=2.0,
                        help='Delay between requests in seconds (default: 2.0)')
     
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     # Create and run scraper
     scraper = IbizaSpotlightScraper(
@@ -9,28 +9,93 @@ This scraper automatically detects which parsing strategy to use for each venue:
 - JavaScript-rendered sites (Flex, U4, Prater Dome)
 
 Usage:
-    python website-scrapers/intelligent_scraper.py <venue-key> [--dry-run] [--debug]
+    python website-scrapers/intelligent_scraper.py <venue-key> [--dry-run] [--debug] [--no-cache]
 """
 
 import argparse
+import hashlib
+import json
 import sys
 import os
 import re
-from typing import List, Dict, Optional
+import tempfile
+from dataclasses import dataclass, asdict
+from typing import Iterable, Iterator, List, Dict, Optional
 from datetime import datetime
+from itertools import pairwise
+from string import ascii_letters
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+import base_scraper
+from base_scraper import BaseVenueScraper, HTTP_CACHE_DISABLE_ENV, parse_scraper_args
 from venue_configs import get_venue_config, list_venues
 
+# On-disk cache of parsed events keyed by page content hash
+PARSE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'where2go')
+PARSE_CACHE_MAX_ENTRIES = 20  # per venue, least recently used entries are evicted
+
+
+def _parser_source_digest() -> str:
+    """
+    Digest of the parsing code (this module and base_scraper).
+    
+    Part of the parse cache key, so any change to a parser or to the shared
+    date/time helpers invalidates events cached by the previous code.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for path in (__file__, base_scraper.__file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+PARSE_CACHE_VERSION = _parser_source_digest()
+
+# Celeste line patterns: "Event Name DD-MM | HH:MM-HH:MM| Club|Artists"
+CELESTE_DATE_RE = re.compile(r'(\d{1,2})-(\d{1,2})')
+CELESTE_TIME_RE = re.compile(r'(\d{2}:\d{2})-\d{2}:\d{2}')
+
+
+@dataclass(slots=True)
+class ParsedEvent:
+    """Event extracted by one of the parsing strategies (converted to a dict on return)"""
+    title: str
+    date: str
+    time: Optional[str] = None
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    detail_url: Optional[str] = None
+
 
 class IntelligentVenueScraper(BaseVenueScraper):
     """
     Intelligent scraper that auto-detects venue structure and applies correct parsing strategy
     """
     
+    # Venue key -> parsing strategy (unknown venues fall back to plain_text)
+    _STRATEGY_MAP = {
+        # Strategy 1: Celeste (pipe-separated table)
+        'celeste': "pipe_separated_table",
+        # Strategy 2: Chelsea (inline data table)
+        'chelsea': "inline_data_table",
+        # Strategy 3: Plain text format (Grelle Forelle, Das Werk, B72, SASS, The Loft, rhiz)
+        'grelle-forelle': "plain_text",
+        'das-werk': "plain_text",
+        'b72': "plain_text",
+        'sass-music-club': "plain_text",
+        'the-loft': "plain_text",
+        'rhiz': "plain_text",
+        # Strategy 4: Structured HTML (Flex, U4, O der Klub, Prater Dome, Praterstrasse, Flucc)
+        'flex': "structured_html",
+        'u4': "structured_html",
+        'o-der-klub': "structured_html",
+        'prater-dome': "structured_html",
+        'praterstrasse': "structured_html",
+        'flucc': "structured_html",
+    }
+    
     def __init__(self, venue_key: str, config: dict, dry_run: bool = False, debug: bool = False):
         self.venue_key = venue_key
         self.VENUE_NAME = config['venue_name']
@@ -41,89 +106,87 @@ class IntelligentVenueScraper(BaseVenueScraper):
         self.SUBCATEGORY = config.get('subcategory', 'Electronic')
         self.config = config
         
+        # Reference time for year inference, refreshed once per scrape_events() call
+        self._now = datetime.now()
+        
         super().__init__(dry_run, debug)
     
     def scrape_events(self) -> List[Dict]:
         """Main scraping method with automatic strategy detection"""
-        self.log(f"🔍 Fetching events from {self.EVENTS_URL}")
+        self._now = datetime.now()
+        
+        # Auto-detect parsing strategy based on venue (before fetching: not every
+        # strategy consumes the page)
+        strategy = self._detect_strategy()
+        self.log(f"📋 Detected strategy: {strategy}", level="info")
+        
+        if strategy == "structured_html":
+            return self._parse_structured_html()
         
-        soup = self.fetch_page(self.EVENTS_URL)
-        if not soup:
-            self.log("❌ Failed to fetch page", "error")
+        self.log(f"🔍 Fetching events from {self.EVENTS_URL}")
+        html = self.fetch_html(self.EVENTS_URL)
+        if not html:
+            self.log("❌ Failed to fetch page", level="error")
             return []
         
-        # Auto-detect parsing strategy based on venue
-        strategy = self._detect_strategy(soup)
-        self.log(f"📋 Detected strategy: {strategy}", "info")
+        # Identical page content parses to identical events - reuse the last result.
+        # Dry runs (parser development) and --no-cache runs always parse the page
+        cache_path = None
+        if not self.dry_run and not os.getenv(HTTP_CACHE_DISABLE_ENV):
+            cache_path = self._parse_cache_path(html)
+            cached_events = self._load_cached_events(cache_path)
+            if cached_events is not None:
+                self.log(f"♻️  Page unchanged, reusing {len(cached_events)} cached events", level="info")
+                return cached_events
+        
+        soup = self.parse_html(html)
         
         # Apply appropriate parsing strategy
         if strategy == "plain_text":
-            return self._parse_plain_text(soup)
+            events = self._parse_plain_text(soup)
         elif strategy == "pipe_separated_table":
-            return self._parse_celeste_format(soup)
+            events = self._parse_celeste_format(soup)
         elif strategy == "inline_data_table":
-            return self._parse_chelsea_format(soup)
-        elif strategy == "structured_html":
-            return self._parse_structured_html(soup)
+            events = self._parse_chelsea_format(soup)
         else:
-            self.log(f"⚠️  Unknown strategy: {strategy}, using fallback", "warning")
-            return self._parse_plain_text(soup)
+            self.log(f"⚠️  Unknown strategy: {strategy}, using fallback", level="warning")
+            events = self._parse_plain_text(soup)
+        
+        events = [asdict(event) for event in events]
+        if cache_path:
+            self._store_cached_events(cache_path, events)
+        return events
     
-    def _detect_strategy(self, soup) -> str:
+    def _detect_strategy(self) -> str:
         """Automatically detect which parsing strategy to use"""
-        
-        # Strategy 1: Celeste (pipe-separated table)
-        if self.venue_key == 'celeste':
-            return "pipe_separated_table"
-        
-        # Strategy 2: Chelsea (inline data table)
-        if self.venue_key == 'chelsea':
-            return "inline_data_table"
-        
-        # Strategy 3: Plain text format (Grelle Forelle, Das Werk, B72, SASS, The Loft, rhiz)
-        if self.venue_key in ['grelle-forelle', 'das-werk', 'b72', 'sass-music-club', 'the-loft', 'rhiz']:
-            return "plain_text"
-        
-        # Strategy 4: Structured HTML (Flex, U4, O der Klub, Prater Dome, Praterstrasse, Flucc)
-        if self.venue_key in ['flex', 'u4', 'o-der-klub', 'prater-dome', 'praterstrasse', 'flucc']:
-            return "structured_html"
-        
-        # Default fallback
-        return "plain_text"
+        return self._STRATEGY_MAP.get(self.venue_key, "plain_text")
     
     # ============================================================================
     # STRATEGY 1: Plain Text Parsing
     # ============================================================================
     
-    def _parse_plain_text(self, soup) -> List[Dict]:
+    def _parse_plain_text(self, soup) -> List[ParsedEvent]:
         """
         Parse events from plain text content
         Works for: Grelle Forelle, Das Werk, B72, SASS, The Loft, rhiz
         """
         self.log("📄 Using plain text parsing strategy")
         
-        # Get all text content
-        text = soup.get_text()
         events = []
         
-        # Venue-specific parsing
-        if self.venue_key == 'grelle-forelle':
-            events = self._parse_grelle_forelle(text)
-        elif self.venue_key == 'das-werk':
-            events = self._parse_das_werk(text)
-        elif self.venue_key == 'b72':
-            events = self._parse_b72(text)
-        elif self.venue_key == 'sass-music-club':
-            events = self._parse_sass(text)
-        elif self.venue_key == 'the-loft':
-            events = self._parse_the_loft(text)
-        elif self.venue_key == 'rhiz':
-            events = self._parse_rhiz(text)
+        # Venue-specific parsing. Line-based parsers consume a stream of lines;
+        # the regex parsers match across line breaks and need the full text.
+        parser = self._PLAIN_TEXT_PARSERS.get(self.venue_key)
+        if parser:
+            if self.venue_key in self._FULL_TEXT_PARSERS:
+                events = parser(self, soup.get_text())
+            else:
+                events = parser(self, self._iter_lines(soup))
         
         self.log(f"✅ Found {len(events)} events using plain text parsing")
         return events
     
-    def _parse_grelle_forelle(self, text: str) -> List[Dict]:
+    def _parse_grelle_forelle(self, text: str) -> List[ParsedEvent]:
         """Parse Grelle Forelle format: '15/11 CONTRAST pres. CRITICAL MUSIC w/ ENEI...'"""
         events = []
         
@@ -138,30 +201,29 @@ class IntelligentVenueScraper(BaseVenueScraper):
             
             # Parse date
             day, month = date_str.split('/')
-            current_year = datetime.now().year
+            current_year = self._now.year
             date = f"{current_year}-{month.zfill(2)}-{day.zfill(2)}"
             
-            events.append({
-                'title': title,
-                'date': date,
-                'time': None,
-                'description': f"Age: {age_restriction}+" if age_restriction else None,
-                'image_url': None,
-                'detail_url': f"{self.BASE_URL}/programm/",
-            })
+            events.append(ParsedEvent(
+                title=title,
+                date=date,
+                time=None,
+                description=f"Age: {age_restriction}+" if age_restriction else None,
+                image_url=None,
+                detail_url=f"{self.BASE_URL}/programm/",
+            ))
         
         return events
     
-    def _parse_das_werk(self, text: str) -> List[Dict]:
+    def _parse_das_werk(self, lines: Iterable[str]) -> List[ParsedEvent]:
         """Parse Das Werk format: 'Freitag 21. November\n19:00 Uhr\nAUSTIN GIORGI...'"""
         events = []
         
         # Pattern: Day DD. Month followed by time and title
-        lines = text.split('\n')
         current_date = None
         current_time = None
         
-        for i, line in enumerate(lines):
+        for line in lines:
             line = line.strip()
             
             # Detect date: "Freitag 21. November"
@@ -171,7 +233,7 @@ class IntelligentVenueScraper(BaseVenueScraper):
                 month_name = date_match.group(2)
                 month = self._parse_german_month(month_name)
                 if month:
-                    year = datetime.now().year
+                    year = self._now.year
                     current_date = f"{year}-{month:02d}-{day:02d}"
             
             # Detect time: "19:00 Uhr" or "23:00 Uhr"
@@ -179,30 +241,30 @@ class IntelligentVenueScraper(BaseVenueScraper):
             if time_match:
                 current_time = time_match.group(1)
             
-            # Detect title (uppercase, multiple words)
-            if line.isupper() and len(line) > 5 and current_date:
-                events.append({
-                    'title': line,
-                    'date': current_date,
-                    'time': current_time,
-                    'description': None,
-                    'image_url': None,
-                    'detail_url': f"{self.BASE_URL}/programm/",
-                })
+            # Detect title (uppercase, multiple words). Most lines fail the cheap
+            # date/length checks, so run those before the isupper() scan.
+            if current_date and len(line) > 5 and line.isupper():
+                events.append(ParsedEvent(
+                    title=line,
+                    date=current_date,
+                    time=current_time,
+                    description=None,
+                    image_url=None,
+                    detail_url=f"{self.BASE_URL}/programm/",
+                ))
         
         return events
     
-    def _parse_b72(self, text: str) -> List[Dict]:
+    def _parse_b72(self, lines: Iterable[str]) -> List[ParsedEvent]:
         """Parse B72 format: 'September\n15.09\nGoldie Boutilier\nTickets...'"""
         events = []
         
-        lines = text.split('\n')
         current_month = None
-        current_year = datetime.now().year
+        current_year = self._now.year
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            
+        # Walk (line, next_line) pairs so the title is read without indexing;
+        # each line is stripped exactly once
+        for line, next_line in pairwise(line.strip() for line in lines):
             # Detect month header
             month_match = re.match(r'^(January|February|March|April|May|June|July|August|September|October|November|December)$', line, re.IGNORECASE)
             if month_match:
@@ -215,36 +277,31 @@ class IntelligentVenueScraper(BaseVenueScraper):
                 day = int(date_match.group(1))
                 month = int(date_match.group(2))
                 
-                # Get title from next line
-                if i + 1 < len(lines):
-                    title = lines[i + 1].strip()
-                    
-                    # Determine year (if month passed, use next year)
-                    if month < datetime.now().month:
-                        year = current_year + 1
-                    else:
-                        year = current_year
-                    
-                    events.append({
-                        'title': title,
-                        'date': f"{year}-{month:02d}-{day:02d}",
-                        'time': None,
-                        'description': None,
-                        'image_url': None,
-                        'detail_url': f"{self.BASE_URL}/program",
-                    })
+                # Determine year (if month passed, use next year)
+                if month < self._now.month:
+                    year = current_year + 1
+                else:
+                    year = current_year
+                
+                events.append(ParsedEvent(
+                    title=next_line,
+                    date=f"{year}-{month:02d}-{day:02d}",
+                    time=None,
+                    description=None,
+                    image_url=None,
+                    detail_url=f"{self.BASE_URL}/program",
+                ))
         
         return events
     
-    def _parse_sass(self, text: str) -> List[Dict]:
+    def _parse_sass(self, lines: Iterable[str]) -> List[ParsedEvent]:
         """Parse SASS format: 'Do 7. Aug\n23:00 - 06:00\nfm.einfamilienhaus...'"""
         events = []
         
-        lines = text.split('\n')
         current_date = None
         current_time = None
         
-        for i, line in enumerate(lines):
+        for line in lines:
             line = line.strip()
             
             # Detect date: "Do 7. Aug" or "Fr 8. Aug"
@@ -254,8 +311,8 @@ class IntelligentVenueScraper(BaseVenueScraper):
                 month_name = date_match.group(2)
                 month = self._parse_german_month(month_name)
                 if month:
-                    year = datetime.now().year
-                    if month < datetime.now().month:
+                    year = self._now.year
+                    if month < self._now.month:
                         year += 1
                     current_date = f"{year}-{month:02d}-{day:02d}"
             
@@ -267,18 +324,18 @@ class IntelligentVenueScraper(BaseVenueScraper):
             # Detect title (starts with ###)
             if line.startswith('###') and current_date:
                 title = line.replace('###', '').strip()
-                events.append({
-                    'title': title,
-                    'date': current_date,
-                    'time': current_time,
-                    'description': None,
-                    'image_url': None,
-                    'detail_url': f"{self.BASE_URL}/programm",
-                })
+                events.append(ParsedEvent(
+                    title=title,
+                    date=current_date,
+                    time=current_time,
+                    description=None,
+                    image_url=None,
+                    detail_url=f"{self.BASE_URL}/programm",
+                ))
         
         return events
     
-    def _parse_the_loft(self, text: str) -> List[Dict]:
+    def _parse_the_loft(self, text: str) -> List[ParsedEvent]:
         """Parse The Loft format: 'Do. 20.11.2025 18:00, Eintritt: € 24/26\nOpen Jazz Vienna...'"""
         events = []
         
@@ -293,66 +350,87 @@ class IntelligentVenueScraper(BaseVenueScraper):
             time = match.group(5)
             title = match.group(6).strip()
             
-            events.append({
-                'title': title,
-                'date': f"{year}-{month:02d}-{day:02d}",
-                'time': time,
-                'description': None,
-                'image_url': None,
-                'detail_url': f"{self.BASE_URL}/programm/",
-            })
+            events.append(ParsedEvent(
+                title=title,
+                date=f"{year}-{month:02d}-{day:02d}",
+                time=time,
+                description=None,
+                image_url=None,
+                detail_url=f"{self.BASE_URL}/programm/",
+            ))
         
         return events
     
-    def _parse_rhiz(self, text: str) -> List[Dict]:
+    def _parse_rhiz(self, lines: Iterable[str]) -> List[ParsedEvent]:
         """Parse rhiz format: 'do 100725 20:00LiveNØ MAN (US) + support...'"""
         events = []
         
-        # Pattern: "do DDMMYY HH:MM Live TITLE"
-        pattern = r'([a-z]{2})\s+(\d{6})\s+(\d{2}:\d{2})[A-Za-z]*([^\n]+)'
-        matches = re.finditer(pattern, text, re.MULTILINE)
-        
-        for match in matches:
-            date_str = match.group(2)  # "100725"
-            time = match.group(3)
-            title = match.group(4).strip()
+        # Fixed-width prefix "do DDMMYY HH:MM" followed by an optional tag and the title.
+        # Plain index/slice checks are enough for this rigid layout - no regex needed.
+        for line in lines:
+            line = line.strip()
+            if len(line) < 16 or line[2] != ' ' or line[9] != ' ' or line[12] != ':':
+                continue
+            
+            weekday = line[0:2]
+            date_str = line[3:9]  # "100725"
+            time = line[10:15]
+            if not (weekday.isalpha() and weekday.islower() and date_str.isdecimal()
+                    and time[0:2].isdecimal() and time[3:5].isdecimal()):
+                continue
+            
+            # Skip the category tag glued to the time ("20:00Live...")
+            title = line[15:].lstrip(ascii_letters).strip()
+            if not title:
+                continue
             
             # Parse date: DDMMYY
             day = int(date_str[0:2])
             month = int(date_str[2:4])
             year = 2000 + int(date_str[4:6])
             
-            events.append({
-                'title': title,
-                'date': f"{year}-{month:02d}-{day:02d}",
-                'time': time,
-                'description': None,
-                'image_url': None,
-                'detail_url': f"{self.BASE_URL}/programm/",
-            })
+            events.append(ParsedEvent(
+                title=title,
+                date=f"{year}-{month:02d}-{day:02d}",
+                time=time,
+                description=None,
+                image_url=None,
+                detail_url=f"{self.BASE_URL}/programm/",
+            ))
         
         return events
     
+    # Venue key -> plain text parser
+    _PLAIN_TEXT_PARSERS = {
+        'grelle-forelle': _parse_grelle_forelle,
+        'das-werk': _parse_das_werk,
+        'b72': _parse_b72,
+        'sass-music-club': _parse_sass,
+        'the-loft': _parse_the_loft,
+        'rhiz': _parse_rhiz,
+    }
+    
+    # Plain text parsers that take the full page text instead of a line stream
+    _FULL_TEXT_PARSERS = frozenset({'grelle-forelle', 'the-loft'})
+    
     # ============================================================================
     # STRATEGY 2: Pipe-Separated Table (Celeste)
     # ============================================================================
     
-    def _parse_celeste_format(self, soup) -> List[Dict]:
+    def _parse_celeste_format(self, soup) -> List[ParsedEvent]:
         """Parse Celeste's pipe-separated table format"""
         self.log("📊 Using pipe-separated table parsing (Celeste)")
         
         events = []
-        text = soup.get_text()
         
         # Pattern: "Event Name DD-MM | HH:MM-HH:MM| Club|Artists"
-        lines = text.split('\n')
-        
-        for line in lines:
-            if '|' not in line or len(line) < 10:
+        for line in self._iter_lines(soup):
+            # Length check first: it is O(1) and rejects most (short/empty) lines
+            if len(line) < 10 or '|' not in line:
                 continue
             
             # Extract date pattern DD-MM
-            date_match = re.search(r'(\d{1,2})-(\d{1,2})', line)
+            date_match = CELESTE_DATE_RE.search(line)
             if not date_match:
                 continue
             
@@ -364,22 +442,22 @@ class IntelligentVenueScraper(BaseVenueScraper):
             title = line[:title_end].strip()
             
             # Extract time
-            time_match = re.search(r'(\d{2}:\d{2})-\d{2}:\d{2}', line)
+            time_match = CELESTE_TIME_RE.search(line)
             time = time_match.group(1) if time_match else None
             
             # Determine year
-            year = datetime.now().year
-            if month < datetime.now().month:
+            year = self._now.year
+            if month < self._now.month:
                 year += 1
             
-            events.append({
-                'title': title,
-                'date': f"{year}-{month:02d}-{day:02d}",
-                'time': time,
-                'description': line,
-                'image_url': None,
-                'detail_url': self.BASE_URL,
-            })
+            events.append(ParsedEvent(
+                title=title,
+                date=f"{year}-{month:02d}-{day:02d}",
+                time=time,
+                description=line,
+                image_url=None,
+                detail_url=self.BASE_URL,
+            ))
         
         self.log(f"✅ Found {len(events)} events using pipe-separated parsing")
         return events
@@ -388,7 +466,7 @@ class IntelligentVenueScraper(BaseVenueScraper):
     # STRATEGY 3: Inline Data Table (Chelsea)
     # ============================================================================
     
-    def _parse_chelsea_format(self, soup) -> List[Dict]:
+    def _parse_chelsea_format(self, soup) -> List[ParsedEvent]:
         """Parse Chelsea's inline data table format"""
         self.log("📋 Using inline data table parsing (Chelsea)")
         
@@ -412,8 +490,8 @@ class IntelligentVenueScraper(BaseVenueScraper):
             
             day = int(date_match.group(1))
             month = int(date_match.group(2))
-            year = datetime.now().year
-            if month < datetime.now().month:
+            year = self._now.year
+            if month < self._now.month:
                 year += 1
             
             # Extract title (first line before VVK: or Doors:)
@@ -423,14 +501,14 @@ class IntelligentVenueScraper(BaseVenueScraper):
             time_match = re.search(r'Doors:\s*(\d+)h', details_text)
             time = f"{time_match.group(1)}:00" if time_match else None
             
-            events.append({
-                'title': title_match,
-                'date': f"{year}-{month:02d}-{day:02d}",
-                'time': time,
-                'description': details_text,
-                'image_url': None,
-                'detail_url': self.EVENTS_URL,
-            })
+            events.append(ParsedEvent(
+                title=title_match,
+                date=f"{year}-{month:02d}-{day:02d}",
+                time=time,
+                description=details_text,
+                image_url=None,
+                detail_url=self.EVENTS_URL,
+            ))
         
         self.log(f"✅ Found {len(events)} events using inline data table parsing")
         return events
@@ -439,16 +517,79 @@ class IntelligentVenueScraper(BaseVenueScraper):
     # STRATEGY 4: Structured HTML (Future: JavaScript-rendered sites)
     # ============================================================================
     
-    def _parse_structured_html(self, soup) -> List[Dict]:
-        """Parse structured HTML (placeholder for JS-rendered sites)"""
-        self.log("⚠️  Structured HTML parsing not yet implemented for this venue", "warning")
-        self.log("💡 This venue likely needs JavaScript rendering with Playwright", "info")
+    def _parse_structured_html(self) -> List[Dict]:
+        """Parse structured HTML (placeholder for JS-rendered sites - the static page is not fetched)"""
+        self.log("⚠️  Structured HTML parsing not yet implemented for this venue", level="warning")
+        self.log("💡 This venue likely needs JavaScript rendering with Playwright", level="info")
         return []
     
     # ============================================================================
     # Helper Methods
     # ============================================================================
     
+    def _parse_cache_path(self, html: str) -> str:
+        """
+        Cache file for a page's parsed events.
+        
+        The key covers the page content, the parsing code (PARSE_CACHE_VERSION)
+        and the current month, since dates without a year are resolved relative
+        to today.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{PARSE_CACHE_VERSION}:{self._now:%Y-%m}:".encode())
+        digest.update(html.encode('utf-8', 'surrogatepass'))
+        return os.path.join(PARSE_CACHE_DIR, self.venue_key, f"{digest.hexdigest()}.json")
+    
+    def _load_cached_events(self, path: str) -> Optional[List[Dict]]:
+        """Load cached events, or None on a cache miss"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                events = json.load(f)
+            os.utime(path)  # Mark as recently used for eviction
+            return events
+        except (OSError, ValueError):
+            return None
+    
+    def _store_cached_events(self, path: str, events: List[Dict]):
+        """Atomically write events to the cache and evict the least recently used entries"""
+        cache_dir = os.path.dirname(path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(events, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            
+            entries = [
+                os.path.join(cache_dir, name)
+                for name in os.listdir(cache_dir)
+                if name.endswith('.json')
+            ]
+            entries.sort(key=os.path.getmtime, reverse=True)
+            for stale in entries[PARSE_CACHE_MAX_ENTRIES:]:
+                os.remove(stale)
+        except OSError as e:
+            self.log(f"Could not write parse cache: {e}", level="warning")
+    
+    def _iter_lines(self, soup) -> Iterator[str]:
+        """
+        Yield the lines of soup.get_text() without building the full text.
+        
+        Text nodes are split on newlines as they stream by; a line spanning
+        several nodes is stitched together before it is yielded.
+        """
+        pending = []
+        for string in soup.strings:
+            parts = string.split('\n')
+            if len(parts) == 1:
+                pending.append(string)
+                continue
+            pending.append(parts[0])
+            yield ''.join(pending)
+            yield from parts[1:-1]
+            pending = [parts[-1]]
+        yield ''.join(pending)
+    
     def _parse_german_month(self, month_name: str) -> Optional[int]:
         """Convert German/English month name to number"""
         months = {
@@ -494,10 +635,8 @@ Examples:
     )
     
     parser.add_argument('venue', help='Venue key to scrape')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
     
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     # Get venue configuration
     config = get_venue_config(args.venue)
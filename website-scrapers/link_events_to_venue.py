@@ -12,7 +12,9 @@ Usage:
 import sys
 import os
 import argparse
-from typing import Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
@@ -25,13 +27,27 @@ except ImportError:
     SUPABASE_AVAILABLE = False
     sys.exit(1)
 
+# Number of events fetched per request in get_unlinked_events
+EVENTS_PAGE_SIZE = 1000
 
+# Minimum trigram similarity for fuzzy venue matches in the link_events_to_venues() RPC
+FUZZY_MATCH_THRESHOLD = 0.6
+
+_WS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
 def normalize_venue_name(name: str) -> str:
     """Normalize venue name for matching"""
     if not name:
         return ""
     # Convert to lowercase and remove extra spaces
-    return ' '.join(name.lower().strip().split())
+    return _WS_RE.sub(' ', name.strip().lower())
+
+
+def venue_key(name: str, city: str) -> str:
+    """Build the lookup key for a venue name and city (single str hash instead of a tuple)"""
+    return f"{normalize_venue_name(name)}\x00{city.lower()}"
 
 
 def init_supabase() -> Optional[Client]:
@@ -56,14 +72,12 @@ def init_supabase() -> Optional[Client]:
 def get_venues(supabase: Client) -> Dict[str, Dict]:
     """Fetch all venues and create a lookup dict by normalized name and city"""
     try:
-        response = supabase.table('venues').select('*').execute()
+        # Only the columns needed for matching - venue rows can be wide
+        response = supabase.table('venues').select('id,name,city').execute()
         venues = response.data
         
-        # Create lookup dict: (normalized_name, city) -> venue
-        venue_lookup = {}
-        for venue in venues:
-            key = (normalize_venue_name(venue['name']), venue['city'].lower())
-            venue_lookup[key] = venue
+        # Create lookup dict: venue_key(name, city) -> venue
+        venue_lookup = {venue_key(v['name'], v['city']): v for v in venues}
         
         print(f"✓ Loaded {len(venues)} venues")
         return venue_lookup
@@ -72,16 +86,81 @@ def get_venues(supabase: Client) -> Dict[str, Dict]:
         return {}
 
 
-def get_unlinked_events(supabase: Client) -> List[Dict]:
-    """Fetch events that have custom_venue_name but no venue_id"""
+def get_unlinked_events(supabase: Client, page_size: int = EVENTS_PAGE_SIZE) -> Iterator[List[Dict]]:
+    """
+    Fetch events that have custom_venue_name but no venue_id, one page at a time.
+    
+    Pages are keyed on id rather than OFFSET: linking an event removes it from
+    the filtered set, which would shift OFFSET windows and skip rows.
+    """
+    last_id = None
+    total = 0
+    while True:
+        try:
+            query = supabase.table('events').select('id,custom_venue_name,city').is_('venue_id', 'null').not_.is_('custom_venue_name', 'null')
+            if last_id is not None:
+                query = query.gt('id', last_id)
+            response = query.order('id').limit(page_size).execute()
+            events = response.data
+        except Exception as e:
+            print(f"❌ Error fetching events: {e}")
+            return
+        
+        if not events:
+            break
+        
+        total += len(events)
+        yield events
+        
+        if len(events) < page_size:
+            break
+        last_id = events[-1]['id']
+    
+    print(f"✓ Found {total} unlinked events")
+
+
+def link_events_via_rpc(supabase: Client) -> Optional[Dict]:
+    """
+    Link all matching events server-side in one round trip.
+    
+    Uses the link_events_to_venues() function (migrations 005/014), which
+    falls back to pg_trgm similarity for names without an exact match.
+    Returns linking stats, or None if the RPC is unavailable.
+    """
     try:
-        response = supabase.table('events').select('id, custom_venue_name, city').is_('venue_id', 'null').not_.is_('custom_venue_name', 'null').execute()
-        events = response.data
-        print(f"✓ Found {len(events)} unlinked events")
-        return events
+        response = supabase.rpc('link_events_to_venues', {
+            'p_sources': None,
+            'p_sim_match_threshold': FUZZY_MATCH_THRESHOLD,
+        }).execute()
     except Exception as e:
-        print(f"❌ Error fetching events: {e}")
-        return []
+        print(f"⚠️  link_events_to_venues RPC failed, linking client-side: {e}")
+        return None
+    
+    # Single row of OUT parameters: {events_linked, events_unmatched}
+    row = response.data[0] if isinstance(response.data, list) else response.data
+    if not row:
+        return None
+    return {
+        'linked': row.get('events_linked') or 0,
+        'errors': 0,
+        'not_found': row.get('events_unmatched') or 0,
+    }
+
+
+def print_summary(stats: Dict):
+    """Print linking statistics"""
+    print(f"\n{'=' * 70}")
+    print("Summary:")
+    print("=" * 70)
+    print(f"  Events linked:       {stats['linked']}")
+    print(f"  Venues not found:    {stats['not_found']}")
+    print(f"  Errors:              {stats['errors']}")
+    print("=" * 70)
+    
+    if stats['not_found'] > 0:
+        print("\n💡 Tip: Some venues were not found. Make sure to:")
+        print("   1. Run venue scrapers or import venue data first")
+        print("   2. Check that venue names match between events and venues")
 
 
 def link_events_to_venues(supabase: Client, dry_run: bool = False, debug: bool = False) -> Dict:
@@ -94,69 +173,66 @@ def link_events_to_venues(supabase: Client, dry_run: bool = False, debug: bool =
     if dry_run:
         print("⚠️  Running in DRY-RUN mode (no database writes)\n")
     
-    # Get all venues
+    # Preferred: a single UPDATE ... FROM join in the database
+    if not dry_run:
+        stats = link_events_via_rpc(supabase)
+        if stats is not None:
+            print(f"✓ Linked {stats['linked']} events server-side")
+            print_summary(stats)
+            return stats
+    
+    # Fallback (and dry runs): match client-side against a venue lookup
     venue_lookup = get_venues(supabase)
     if not venue_lookup:
         print("❌ No venues found. Please run venue scrapers first.")
         return {'linked': 0, 'errors': 0, 'not_found': 0}
     
-    # Get unlinked events
-    unlinked_events = get_unlinked_events(supabase)
-    if not unlinked_events:
-        print("✓ No unlinked events found. All events are already linked!")
-        return {'linked': 0, 'errors': 0, 'not_found': 0}
-    
     stats = {'linked': 0, 'errors': 0, 'not_found': 0}
+    processed = 0
     
-    print(f"\nProcessing {len(unlinked_events)} events...\n")
+    print("\nProcessing unlinked events...\n")
     
-    for event in unlinked_events:
-        event_id = event['id']
-        venue_name = event.get('custom_venue_name', '')
-        city = event.get('city', 'Wien')
-        
-        if not venue_name:
-            continue
-        
-        # Try to find matching venue
-        key = (normalize_venue_name(venue_name), city.lower())
-        venue = venue_lookup.get(key)
-        
-        if venue:
-            if debug:
-                print(f"  Linking event {event_id[:8]}... to venue '{venue['name']}'")
+    # Process page by page so memory stays bounded by the page size
+    for page in get_unlinked_events(supabase):
+        processed += len(page)
+        for event in page:
+            event_id = event['id']
+            venue_name = event.get('custom_venue_name', '')
+            city = event.get('city', 'Wien')
+            
+            if not venue_name:
+                continue
+            
+            # Try to find matching venue
+            venue = venue_lookup.get(venue_key(venue_name, city))
             
-            if not dry_run:
-                try:
-                    supabase.table('events').update({
-                        'venue_id': venue['id']
-                    }).eq('id', event_id).execute()
+            if venue:
+                if debug:
+                    print(f"  Linking event {event_id[:8]}... to venue '{venue['name']}'")
+                
+                if not dry_run:
+                    try:
+                        supabase.table('events').update({
+                            'venue_id': venue['id']
+                        }).eq('id', event_id).execute()
+                        stats['linked'] += 1
+                        print(f"  ✓ Linked: {venue_name} -> {venue['name']}")
+                    except Exception as e:
+                        stats['errors'] += 1
+                        print(f"  ❌ Error linking event {event_id[:8]}...: {e}")
+                else:
                     stats['linked'] += 1
-                    print(f"  ✓ Linked: {venue_name} -> {venue['name']}")
-                except Exception as e:
-                    stats['errors'] += 1
-                    print(f"  ❌ Error linking event {event_id[:8]}...: {e}")
+                    print(f"  ✓ Would link: {venue_name} -> {venue['name']}")
             else:
-                stats['linked'] += 1
-                print(f"  ✓ Would link: {venue_name} -> {venue['name']}")
-        else:
-            stats['not_found'] += 1
-            if debug:
-                print(f"  ⚠️  No venue found for: {venue_name} (city: {city})")
-    
-    # Print summary
-    print(f"\n{'=' * 70}")
-    print("Summary:")
-    print("=" * 70)
-    print(f"  Events linked:       {stats['linked']}")
-    print(f"  Venues not found:    {stats['not_found']}")
-    print(f"  Errors:              {stats['errors']}")
-    print("=" * 70)
+                stats['not_found'] += 1
+                if debug:
+                    print(f"  ⚠️  No venue found for: {venue_name} (city: {city})")
     
-    if stats['not_found'] > 0:
-        print("\n💡 Tip: Some venues were not found. Make sure to:")
-        print("   1. Run venue scrapers or import venue data first")
-        print("   2. Check that venue names match between events and venues")
+    if processed == 0:
+        print("✓ No unlinked events found. All events are already linked!")
+        return stats
+    
+    print_summary(stats)
     
     return stats
 
@@ -5,7 +5,7 @@ Extracts upcoming events from https://o-klub.at/events/#upcoming
 and saves them to the Supabase database.
 
 Usage:
-    python website-scrapers/o-klub.py [--dry-run] [--debug]
+    python website-scrapers/o-klub.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
@@ -17,7 +17,29 @@ import argparse
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, ScrapedEvent, TICKET_KEYWORDS, TICKET_LINK_SEL, element_text, extract_artists, parse_scraper_args
+
+# Element ids used inside each Elementor "upcoming_listing" item
+ITEM_FIELD_IDS = ['event_name', 'day', 'month']
+
+# Abbreviated month labels on the listing -> full German month names
+MONTH_MAP = {
+    'JAN': 'Januar', 'FEB': 'Februar', 'MÄR': 'März', 'MAR': 'März',
+    'APR': 'April', 'MAI': 'Mai', 'JUN': 'Juni',
+    'JUL': 'Juli', 'AUG': 'August', 'SEP': 'September',
+    'OKT': 'Oktober', 'NOV': 'November', 'DEZ': 'Dezember', 'DEC': 'Dezember'
+}
+
+# Elements that can carry an event image
+BG_IMAGE_SELECTOR = '[data-dce-background-image-url], [style*="background-image"]'
+BG_STYLE_SELECTOR = '[style*="background-image"]'
+BG_IMAGE_RE = re.compile(r'background-image:\s*url\(["\']?(.*?)["\']?\)')
+
+# Detail page elements searched for a start time
+TIME_TEXT_SELECTOR = 'time, .event-time, .elementor-text-editor, h1, h2, h3, p'
+
+# Boilerplate paragraphs to leave out of event descriptions
+SKIP_TEXT_RE = re.compile(r'cookie|impressum|datenschutz', re.IGNORECASE)
 
 
 class OKlubScraper(BaseVenueScraper):
@@ -47,61 +69,55 @@ class OKlubScraper(BaseVenueScraper):
         
         for idx, item in enumerate(event_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item)
             
-            if event_data and event_data.get('title'):
-                # Visit detail page if available
-                if event_data.get('detail_url'):
-                    self._enrich_from_detail_page(event_data)
-                
+            if event_data and event_data.title:
                 events.append(event_data)
-                status = "✓" if event_data.get('date') else "?"
-                self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
         
-        return events
+        # Visit detail pages concurrently instead of one round trip per event
+        detailed = [event for event in events if event.detail_url]
+        soups = self.fetch_pages([event.detail_url for event in detailed])
+        for event_data, detail_soup in zip(detailed, soups):
+            self._enrich_from_detail_page(event_data, detail_soup)
+        
+        self.log_lines([
+            (f"  ✓ {event_data.title[:50]} - {event_data.date}", "success") if event_data.date
+            else (f"  ? {event_data.title[:50]} - no date", "warning")
+            for event_data in events
+        ])
+        
+        return [event.to_dict() for event in events]
     
-    def _parse_event_item(self, item) -> Optional[Dict]:
+    def _parse_event_item(self, item) -> Optional[ScrapedEvent]:
         """Parse a single event item from O-Klub structure"""
         try:
-            event_data = {
-                'title': None,
-                'date': None,
-                'time': None,
-                'description': None,
-                'image_url': None,
-                'detail_url': None,
-                'ticket_url': None,
-                'price': None,
-                'artists': [],
-            }
+            event_data = ScrapedEvent()
+            
+            # Collect the id="event_name", id="day" and id="month" elements in a
+            # single subtree walk (first occurrence of each id wins)
+            fields = {}
+            for elem in item.find_all(id=ITEM_FIELD_IDS):
+                fields.setdefault(elem['id'], elem)
             
             # Extract title from element with id="event_name"
-            title_elem = item.find(id='event_name')
+            title_elem = fields.get('event_name')
             if title_elem:
-                event_data['title'] = title_elem.get_text(strip=True)
+                event_data.title = element_text(title_elem)
             
             # Extract day and month from elements with id="day" and id="month"
-            day_elem = item.find(id='day')
-            month_elem = item.find(id='month')
+            day_elem = fields.get('day')
+            month_elem = fields.get('month')
             
             if day_elem and month_elem:
-                day = day_elem.get_text(strip=True)
-                month = month_elem.get_text(strip=True)
+                day = element_text(day_elem)
+                month = element_text(month_elem)
                 
                 # Construct date string like "28. November"
-                month_mapping = {
-                    'JAN': 'Januar', 'FEB': 'Februar', 'MÄR': 'März', 'MAR': 'März',
-                    'APR': 'April', 'MAI': 'Mai', 'JUN': 'Juni',
-                    'JUL': 'Juli', 'AUG': 'August', 'SEP': 'September',
-                    'OKT': 'Oktober', 'NOV': 'November', 'DEZ': 'Dezember', 'DEC': 'Dezember'
-                }
-                
-                month_full = month_mapping.get(month.upper(), month)
+                month_full = MONTH_MAP.get(month.upper(), month)
                 date_text = f"{day}. {month_full}"
-                event_data['date'] = self.parse_german_date(date_text)
+                event_data.date = self.parse_german_date(date_text)
             
             # Extract link
             link_elem = item.find('a', href=True)
@@ -109,113 +125,112 @@ class OKlubScraper(BaseVenueScraper):
                 href = link_elem['href']
                 if not href.startswith('http'):
                     href = self.BASE_URL.rstrip('/') + '/' + href.lstrip('/')
-                event_data['detail_url'] = href
+                event_data.detail_url = href
             
-            # Extract image from data-dce-background-image-url attribute
-            for elem in item.find_all(True):
+            # Extract image from data-dce-background-image-url attribute, falling back
+            # to an inline background-image style. One CSS query returns both kinds
+            # of candidates instead of walking every descendant twice.
+            style_image_url = None
+            for elem in item.select(BG_IMAGE_SELECTOR):
                 img_url = elem.get('data-dce-background-image-url')
                 if img_url and 'wp-content/uploads' in img_url:
-                    event_data['image_url'] = img_url
+                    event_data.image_url = img_url
                     if self.debug:
-                        self.log(f"  ✓ Image from data attribute: {img_url[:50]}...", "debug")
+                        self.log(f"  ✓ Image from data attribute: {img_url[:50]}...", level="debug")
                     break
+                
+                if style_image_url is None:
+                    match = BG_IMAGE_RE.search(elem.get('style', ''))
+                    if match:
+                        image_url = match.group(1)
+                        if image_url and 'logo' not in image_url.lower():
+                            style_image_url = image_url
             
-            # Fallback: Extract background image from style attribute
-            if not event_data.get('image_url'):
-                for elem in item.find_all(True):
-                    style = elem.get('style', '')
-                    if 'background-image' in style:
-                        match = re.search(r'background-image:\s*url\(["\']?(.*?)["\']?\)', style)
-                        if match:
-                            image_url = match.group(1)
-                            if image_url and 'logo' not in image_url.lower():
-                                event_data['image_url'] = image_url
-                                break
+            if not event_data.image_url:
+                event_data.image_url = style_image_url
             
-            return event_data if event_data['title'] else None
+            return event_data if event_data.title else None
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
     
-    def _enrich_from_detail_page(self, event_data: Dict):
-        """Enrich event data from detail page"""
-        if not event_data.get('detail_url'):
+    def _enrich_from_detail_page(self, event_data: ScrapedEvent, soup):
+        """Enrich event data from its pre-fetched detail page"""
+        if not soup:
             return
         
         try:
             if self.debug:
-                self.log(f"  Fetching detail page: {event_data['detail_url']}", "debug")
-            
-            soup = self.fetch_page(event_data['detail_url'])
-            if not soup:
-                return
+                self.log(f"  Enriching from detail page: {event_data.detail_url}", level="debug")
             
             # Extract description
             desc_parts = []
             for elem in soup.select('.event-description, .content p, article p, div.elementor-text-editor p'):
                 text = elem.get_text(strip=True)
-                if text and len(text) > 20:
-                    if not any(skip in text.lower() for skip in ['cookie', 'impressum', 'datenschutz']):
-                        desc_parts.append(text)
+                if text and len(text) > 20 and not SKIP_TEXT_RE.search(text):
+                    desc_parts.append(text)
             
             if desc_parts:
-                event_data['description'] = '\n\n'.join(desc_parts[:5])
+                event_data.description = '\n\n'.join(desc_parts[:5])
                 if self.debug:
-                    self.log(f"  ✓ Description: {len(event_data['description'])} chars", "debug")
+                    self.log(f"  ✓ Description: {len(event_data.description)} chars", level="debug")
             
             # Extract lineup/artists
             lineup_elem = soup.select_one('.lineup, .artists, div[class*="lineup"]')
             if lineup_elem:
-                lineup_text = lineup_elem.get_text()
-                artists = re.findall(r'\b[A-Z][A-Za-z\s&]{2,30}\b', lineup_text)
-                event_data['artists'] = list(set(artists))[:10]
+                event_data.artists = extract_artists(lineup_elem.get_text())
                 if self.debug:
-                    self.log(f"  ✓ Artists: {len(event_data['artists'])} found", "debug")
-            
-            # Extract ticket link
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                text = link.get_text().lower()
-                if any(kw in href.lower() or kw in text for kw in ['ticket', 'karte', 'buy', 'kaufen']):
-                    event_data['ticket_url'] = href
-                    if self.debug:
-                        self.log(f"  ✓ Ticket URL found", "debug")
-                    break
+                    self.log(f"  ✓ Artists: {len(event_data.artists)} found", level="debug")
+            
+            # Extract ticket link: match on href with one CSS query, fall back to link text
+            ticket_link = TICKET_LINK_SEL.select_one(soup)
+            if ticket_link is None:
+                for link in soup.find_all('a', href=True):
+                    text = link.get_text().lower()
+                    if any(kw in text for kw in TICKET_KEYWORDS):
+                        ticket_link = link
+                        break
+            
+            if ticket_link is not None:
+                event_data.ticket_url = ticket_link['href']
+                if self.debug:
+                    self.log(f"  ✓ Ticket URL found", level="debug")
             
             # Extract time if not found yet
-            if not event_data.get('time'):
-                page_text = soup.get_text()
-                event_data['time'] = self.parse_time(page_text)
-                if event_data['time'] and self.debug:
-                    self.log(f"  ✓ Time: {event_data['time']}", "debug")
+            if not event_data.time:
+                # Only the elements likely to mention a time, not the whole document
+                page_text = ' '.join(
+                    elem.get_text(' ', strip=True)
+                    for elem in soup.select(TIME_TEXT_SELECTOR, limit=30)
+                )
+                event_data.time = self.parse_time(page_text)
+                if event_data.time and self.debug:
+                    self.log(f"  ✓ Time: {event_data.time}", level="debug")
             
             # Try to get better image if not found yet
-            if not event_data.get('image_url'):
-                for elem in soup.find_all(True, limit=100):
-                    style = elem.get('style', '')
-                    if 'background-image' in style:
-                        match = re.search(r'background-image:\s*url\(["\']?(.*?)["\']?\)', style)
-                        if match:
-                            image_url = match.group(1)
-                            if image_url and 'logo' not in image_url.lower():
-                                event_data['image_url'] = image_url
-                                if self.debug:
-                                    self.log(f"  ✓ Image from detail: {image_url[:50]}...", "debug")
-                                break
+            if not event_data.image_url:
+                # Only elements with an inline background-image are returned
+                for elem in soup.select(BG_STYLE_SELECTOR):
+                    match = BG_IMAGE_RE.search(elem['style'])
+                    if match:
+                        image_url = match.group(1)
+                        if image_url and 'logo' not in image_url.lower():
+                            event_data.image_url = image_url
+                            if self.debug:
+                                self.log(f"  ✓ Image from detail: {image_url[:50]}...", level="debug")
+                            break
             
         except Exception as e:
             if self.debug:
-                self.log(f"  Error enriching from detail page: {e}", "warning")
+                self.log(f"  Error enriching from detail page: {e}", level="warning")
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape O - der Klub events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = OKlubScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
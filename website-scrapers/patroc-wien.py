@@ -11,11 +11,51 @@ Venue names are extracted from the "@ VenueName" format in the address section.
 import sys
 import os
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import argparse
+from functools import lru_cache
+from itertools import islice
 
 sys.path.insert(0, os.path.dirname(__file__))
-from base_scraper import BaseVenueScraper
+import soupsieve as sv
+from bs4 import SoupStrainer
+from base_scraper import BaseVenueScraper, ScrapedEvent, element_text, parse_scraper_args
+
+# Only the event containers are parsed - the listing pages carry large navigation blocks
+EVENT_STRAINER = SoupStrainer('div', class_='vevent')
+
+# Facebook event / Instagram links in an event's communication block
+SOCIAL_LINK_SEL = sv.compile(
+    'div.communication a[href*="facebook.com/events"], '
+    'div.communication a[href*="instagram.com"]'
+)
+
+# Multi-class selectors, compiled once instead of on every select_one() call
+EVENT_ITEM_SEL = sv.compile('div.vevent.item')
+DESCRIPTION_SEL = sv.compile('div.description.notes')
+VENUE_ABBR_SEL = sv.compile('abbr.fn.org')
+
+# Events parsed per listing page
+MAX_EVENTS_PER_PAGE = 50
+
+# Price in the description, e.g. "Eintritt: 13-25 €" or "Tickets: 10-15 €"
+PRICE_RE = re.compile(r'(?:Eintritt|Tickets?):\s*([\d\-€,\.\s]+)')
+
+
+@lru_cache(maxsize=256)
+def _parse_location(venue_text: str, address_text: str) -> Tuple[str, str]:
+    """
+    Split a Patroc address block into (venue name, address).
+    
+    venue_text is the "@ VenueName" span, address_text the full block text.
+    Venues recur across many listings, so results are memoized.
+    """
+    # Remove "@ " prefix
+    venue_name = venue_text[1:].strip() if venue_text.startswith('@') else venue_text
+    if venue_name:
+        # Remove venue name from address
+        address_text = address_text.replace('@ ' + venue_name, '').strip()
+    return venue_name, address_text
 
 
 class PatrocWienGayScraper(BaseVenueScraper):
@@ -32,156 +72,130 @@ class PatrocWienGayScraper(BaseVenueScraper):
     VENUE_ADDRESS = "Wien"  # Default city
     BASE_URL = "https://www.patroc.com"
     EVENTS_URL = "https://www.patroc.com/de/gay/wien/"
+    CLUBS_URL = "https://www.patroc.com/de/gay/wien/clubs.html"
     CATEGORY = "LGBTQ+"
     SUBCATEGORY = "LGBTQ+"
     
     def scrape_events(self) -> List[Dict]:
         """Scrape events from Patroc Wien Gay pages"""
-        self.log(f"Fetching events from {self.EVENTS_URL}")
+        # Main page and clubs page are independent - fetch them concurrently
+        urls = [self.EVENTS_URL, self.CLUBS_URL]
+        for url in urls:
+            self.log(f"Fetching events from {url}")
         
         events = []
+        for url, soup in zip(urls, self.fetch_pages(urls, parse_only=EVENT_STRAINER)):
+            events.extend(self._parse_page(soup, url))
         
-        # Scrape from main page
-        events.extend(self._scrape_page(self.EVENTS_URL))
-        
-        # Scrape from clubs page
-        clubs_url = "https://www.patroc.com/de/gay/wien/clubs.html"
-        self.log(f"Fetching events from {clubs_url}")
-        events.extend(self._scrape_page(clubs_url))
-        
-        return events
+        return [event.to_dict() for event in events]
     
-    def _scrape_page(self, url: str) -> List[Dict]:
-        """Scrape events from a specific page"""
-        soup = self.fetch_page(url)
+    def _parse_page(self, soup, url: str) -> List[ScrapedEvent]:
+        """Parse events from a fetched listing page"""
         if not soup:
             return []
         
         events = []
         
         # Patroc uses div.vevent.item class for event containers
-        event_items = soup.select('div.vevent.item')
+        event_items = EVENT_ITEM_SEL.select(soup)
         
         self.log(f"Found {len(event_items)} events on {url}")
         
-        for idx, item in enumerate(event_items[:50], 1):  # Limit to 50 per page
+        total = min(len(event_items), MAX_EVENTS_PER_PAGE)
+        for idx, item in enumerate(islice(event_items, MAX_EVENTS_PER_PAGE), 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{total}", level="debug")
             
             event_data = self._parse_event_item(item)
             
-            if event_data and event_data.get('title'):
+            if event_data and event_data.title:
                 events.append(event_data)
-                venue_info = event_data.get('venue_name', 'Unknown venue')
-                status = "✓" if event_data.get('date') else "?"
-                self.log(f"  {status} {event_data['title'][:40]} @ {venue_info}", 
-                        "success" if status == "✓" else "warning")
+        
+        self.log_lines([
+            (f"  {'✓' if event_data.date else '?'} {event_data.title[:40]} @ {event_data.venue_name or 'Unknown venue'}",
+             "success" if event_data.date else "warning")
+            for event_data in events
+        ])
         
         return events
     
-    def _parse_event_item(self, item) -> Optional[Dict]:
+    def _parse_event_item(self, item) -> Optional[ScrapedEvent]:
         """Parse a single event item from Patroc structure"""
         try:
-            event_data = {
-                'title': None,
-                'date': None,
-                'time': None,
-                'image_url': None,
-                'detail_url': None,
-                'description': None,
-                'venue_name': None,  # Actual venue for the event
-                'venue_address': None,
-                'price': None,
-            }
+            event_data = ScrapedEvent()
             
             # Extract title from span.summary
-            title_elem = item.select_one('span.summary')
+            title_elem = item.find('span', class_='summary')
             if title_elem:
-                event_data['title'] = title_elem.get_text(strip=True)
+                event_data.title = element_text(title_elem)
             
             # Extract date from abbr.dtstart title attribute (ISO format: 2025-12-05)
-            date_elem = item.select_one('abbr.dtstart')
+            date_elem = item.find('abbr', class_='dtstart')
             if date_elem and date_elem.get('title'):
-                event_data['date'] = date_elem.get('title')
+                event_data.date = date_elem.get('title')
             
             # Extract time from div.open text (format: "Freitag, 5. Dezember 2025, 18:00 – 24:00")
-            open_elem = item.select_one('div.open')
+            open_elem = item.find('div', class_='open')
             if open_elem:
-                open_text = open_elem.get_text(strip=True)
-                event_data['time'] = self.parse_time(open_text)
+                open_text = element_text(open_elem)
+                event_data.time = self.parse_time(open_text)
             
             # Extract detail URL from a.url
-            link_elem = item.select_one('a.url')
+            link_elem = item.find('a', class_='url')
             if link_elem:
                 href = link_elem.get('href')
                 if href:
-                    if href.startswith('d/'):
-                        # Relative URL like "d/event-name.html"
-                        event_data['detail_url'] = self.BASE_URL + '/de/gay/wien/' + href
-                    elif href.startswith('/'):
-                        event_data['detail_url'] = self.BASE_URL + href
-                    elif href.startswith('http'):
-                        event_data['detail_url'] = href
+                    # Relative URLs like "d/event-name.html" live under the Wien listing
+                    event_data.detail_url = self.absolute_url(href, self.EVENTS_URL)
             
             # Extract description from div.description.notes
-            desc_elem = item.select_one('div.description.notes')
+            desc_elem = DESCRIPTION_SEL.select_one(item)
             if desc_elem:
                 desc_text = desc_elem.get_text(strip=True)
-                event_data['description'] = desc_text[:500]
+                event_data.description = desc_text[:500]
                 
                 # Extract price from description (format: "Eintritt: 13-25 €" or "Tickets: 10-15 €")
-                price_match = re.search(r'(?:Eintritt|Tickets?):\s*([\d\-€,\.\s]+)', desc_text)
+                price_match = PRICE_RE.search(desc_text)
                 if price_match:
-                    event_data['price'] = price_match.group(1).strip()
+                    event_data.price = price_match.group(1).strip()
             
             # Extract venue from div.adr - look for "@ VenueName" pattern
-            adr_elem = item.select_one('div.adr')
+            adr_elem = item.find('div', class_='adr')
             if adr_elem:
                 # First span in adr usually contains "@ VenueName"
-                venue_span = adr_elem.select_one('span')
-                if venue_span:
-                    venue_text = venue_span.get_text(strip=True)
-                    # Remove "@ " prefix
-                    if venue_text.startswith('@'):
-                        event_data['venue_name'] = venue_text[1:].strip()
-                    else:
-                        event_data['venue_name'] = venue_text
-                
-                # Also get full address
-                full_adr = adr_elem.get_text(strip=True)
-                if event_data.get('venue_name'):
-                    # Remove venue name from address
-                    full_adr = full_adr.replace('@ ' + event_data['venue_name'], '').strip()
-                event_data['venue_address'] = full_adr
+                venue_span = adr_elem.find('span')
+                venue_text = element_text(venue_span) if venue_span else ''
+                event_data.venue_name, event_data.venue_address = _parse_location(
+                    venue_text, adr_elem.get_text(strip=True)
+                )
             
             # Fallback venue name from abbr.fn.org
-            if not event_data.get('venue_name'):
-                venue_abbr = item.select_one('abbr.fn.org')
+            if not event_data.venue_name:
+                venue_abbr = VENUE_ABBR_SEL.select_one(item)
                 if venue_abbr:
-                    event_data['venue_name'] = venue_abbr.get('title', '')
+                    event_data.venue_name = venue_abbr.get('title', '')
             
             # Try to get event image from Facebook/Instagram links
             # We can't actually fetch these without authentication, but store the links
-            social_links = []
-            for link in item.select('div.communication a'):
-                href = link.get('href', '')
-                if 'facebook.com/events' in href or 'instagram.com' in href:
-                    social_links.append(href)
+            social_links = [
+                link['href']
+                for link in SOCIAL_LINK_SEL.select(item)
+            ]
             
             if social_links:
                 # Store first social link as potential image source (for future enhancement)
-                event_data['social_links'] = social_links
+                event_data.social_links = social_links
             
             # If no venue found, use default
-            if not event_data.get('venue_name'):
-                event_data['venue_name'] = 'LGBTQ+ Venue Wien'
-                event_data['venue_address'] = 'Wien'
+            if not event_data.venue_name:
+                event_data.venue_name = 'LGBTQ+ Venue Wien'
+                event_data.venue_address = 'Wien'
             
-            return event_data if event_data.get('title') else None
+            return event_data if event_data.title else None
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event: {e}", "error")
+                self.log(f"Error parsing event: {e}", level="error")
             return None
     
     def _prepare_event_for_db(self, event: Dict) -> Dict:
@@ -216,9 +230,7 @@ class PatrocWienGayScraper(BaseVenueScraper):
 
 def main():
     parser = argparse.ArgumentParser(description='Scrape Patroc Wien Gay events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = PatrocWienGayScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
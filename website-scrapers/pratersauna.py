@@ -5,19 +5,45 @@ Extracts upcoming events from https://pratersauna.tv
 and saves them to the Supabase database.
 
 Usage:
-    python website-scrapers/pratersauna.py [--dry-run] [--debug]
+    python website-scrapers/pratersauna.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
 import os
 import re
+from datetime import datetime
 from typing import List, Dict, Optional
 import argparse
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+import soupsieve as sv
+from base_scraper import BaseVenueScraper, PrioritySelector, extract_artists, parse_scraper_args
+
+# Selector fallbacks in priority order, compiled once and evaluated in one walk each
+# Pratersauna uses Elementor with loop grid - events have class 'event' and 'type-event'
+EVENT_SELECTORS = PrioritySelector(
+    'article.event.type-event',
+    'div.e-loop-item',
+    'article.event-post',
+    'div.event-item',
+    'article[class*="post"]',
+)
+TITLE_SELECTORS = PrioritySelector('h2', 'h3.event-title', '.wp-block-heading', 'h1', '.elementor-heading-title')
+IMG_SELECTORS = PrioritySelector('figure.wp-block-image img', '.event-image img', 'img.wp-image', 'img')
+DATE_SELECTORS = PrioritySelector('time', '.event-date', 'p.has-text-align-center', '.elementor-heading-title')
+DETAIL_DESC_SELECTORS = PrioritySelector('div.entry-content p', '.event-description', '.wp-block-paragraph')
+TICKET_SELECTORS = PrioritySelector('a[href*="ticket"]', 'a.button', 'a.wp-block-button__link')
+# Detail-page region searched for a time/date when the selectors found none
+DETAIL_TEXT_SEL = sv.compile('main, article, .entry-content')
+
+# Title that is only a date, e.g. "06.12" or "06.12."
+DATE_ONLY_RE = re.compile(r'^\d{1,2}\.\d{1,2}\.?$')
+# DD.MM anywhere in a title
+DATE_IN_TITLE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})')
+# Slug of an event URL, e.g. https://pratersauna.tv/event/<slug>/
+EVENT_SLUG_RE = re.compile(r'/event/([^/]+)')
 
 
 class PratersaunaScraper(BaseVenueScraper):
@@ -34,47 +60,39 @@ class PratersaunaScraper(BaseVenueScraper):
         """Scrape events from Pratersauna"""
         self.log(f"Fetching events from {self.EVENTS_URL}")
         
+        # Reference time for year inference, read once per scrape
+        self._now = datetime.now()
+        
         soup = self.fetch_page(self.EVENTS_URL)
         if not soup:
             return []
         
         events = []
         
-        # Pratersauna uses Elementor with loop grid
-        # Events have class 'event' and 'type-event'
-        event_selectors = [
-            'article.event.type-event',
-            'div.e-loop-item',
-            'article.event-post',
-            'div.event-item',
-            'article[class*="post"]'
-        ]
-        
-        event_items = []
-        for selector in event_selectors:
-            items = soup.select(selector)
-            if items:
-                event_items = items
-                self.log(f"Found {len(items)} items using selector: {selector}", "debug" if self.debug else "info")
-                break
+        selector, event_items = EVENT_SELECTORS.select(soup)
+        if event_items:
+            self.log(f"Found {len(event_items)} items using selector: {selector}", level="debug" if self.debug else "info")
         
         self.log(f"Found {len(event_items)} potential events")
         
         for idx, item in enumerate(event_items, 1):
-            if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+            self.log("Processing event %d/%d", idx, len(event_items), level="debug")
             
             event_data = self._parse_event_item(item)
             
             if event_data and event_data.get('title'):
-                # Visit detail page if available
-                if event_data.get('detail_url'):
-                    self._enrich_from_detail_page(event_data)
-                
                 events.append(event_data)
-                status = "✓" if event_data.get('date') else "?"
-                self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+        
+        # Visit detail pages concurrently instead of one round trip per event
+        detailed = [event for event in events if event.get('detail_url')]
+        soups = self.fetch_pages([event['detail_url'] for event in detailed])
+        for event_data, detail_soup in zip(detailed, soups):
+            self._enrich_from_detail_page(event_data, detail_soup)
+        
+        for event_data in events:
+            status = "✓" if event_data.get('date') else "?"
+            self.log("  %s %.50s - %s", status, event_data['title'], event_data.get('date', 'no date'),
+                     level="success" if status == "✓" else "warning")
         
         return events
     
@@ -102,15 +120,12 @@ class PratersaunaScraper(BaseVenueScraper):
                 event_data['detail_url'] = href
             
             # Extract title - try multiple selectors
-            title_selectors = ['h2', 'h3.event-title', '.wp-block-heading', 'h1', '.elementor-heading-title']
-            for sel in title_selectors:
-                title_elem = item.select_one(sel)
-                if title_elem:
-                    event_data['title'] = title_elem.get_text(strip=True)
-                    break
+            title_elem = TITLE_SELECTORS.select_one(item)
+            if title_elem:
+                event_data['title'] = title_elem.get_text(strip=True)
             
             # Check if title is just a date (DD.MM or DD.MM.) - if so, we need a better title
-            is_date_only_title = event_data['title'] and re.match(r'^\d{1,2}\.\d{1,2}\.?$', event_data['title'].strip())
+            is_date_only_title = event_data['title'] and DATE_ONLY_RE.match(event_data['title'].strip())
             
             if is_date_only_title:
                 # Try to extract event name from URL slug
@@ -121,7 +136,7 @@ class PratersaunaScraper(BaseVenueScraper):
                     for heading in item.select('h2, h3, h4, strong, .event-name'):
                         heading_text = heading.get_text(strip=True)
                         # Skip if it's also just a date
-                        if heading_text and not re.match(r'^\d{1,2}\.\d{1,2}\.?$', heading_text.strip()):
+                        if heading_text and not DATE_ONLY_RE.match(heading_text.strip()):
                             better_title = heading_text
                             break
                 
@@ -130,7 +145,7 @@ class PratersaunaScraper(BaseVenueScraper):
                     img = item.select_one('img[alt]')
                     if img and img.get('alt'):
                         alt_text = img['alt'].strip()
-                        if alt_text and len(alt_text) > 3 and not re.match(r'^\d{1,2}\.\d{1,2}\.?$', alt_text):
+                        if alt_text and len(alt_text) > 3 and not DATE_ONLY_RE.match(alt_text):
                             better_title = alt_text
                 
                 # If we found a better title, use date + title format
@@ -141,47 +156,32 @@ class PratersaunaScraper(BaseVenueScraper):
                     event_data['title'] = f"Pratersauna Event {event_data['title']}"
             
             # Extract image
-            img_selectors = [
-                'figure.wp-block-image img',
-                '.event-image img',
-                'img.wp-image',
-                'img'
-            ]
-            for sel in img_selectors:
-                img_elem = item.select_one(sel)
-                if img_elem:
-                    src = img_elem.get('src') or img_elem.get('data-src')
-                    if src:
-                        if not src.startswith('http'):
-                            src = self.BASE_URL.rstrip('/') + '/' + src.lstrip('/')
-                        event_data['image_url'] = src
-                        break
+            for img_elem in IMG_SELECTORS.iter_first(item):
+                src = img_elem.get('src') or img_elem.get('data-src')
+                if src:
+                    if not src.startswith('http'):
+                        src = self.BASE_URL.rstrip('/') + '/' + src.lstrip('/')
+                    event_data['image_url'] = src
+                    break
             
             # Extract date - try multiple selectors and formats
-            date_selectors = ['time', '.event-date', 'p.has-text-align-center', '.elementor-heading-title']
-            for sel in date_selectors:
-                date_elem = item.select_one(sel)
-                if date_elem:
-                    date_text = date_elem.get_text(strip=True)
-                    parsed_date = self.parse_german_date(date_text)
-                    if parsed_date:
-                        event_data['date'] = parsed_date
-                        break
+            for date_elem in DATE_SELECTORS.iter_first(item):
+                parsed_date = self.parse_german_date(date_elem.get_text(strip=True))
+                if parsed_date:
+                    event_data['date'] = parsed_date
+                    break
             
             # If date not found and title contains DD.MM format, extract from title
             if not event_data['date'] and event_data['title']:
-                match = re.search(r'(\d{1,2})\.(\d{1,2})', event_data['title'])
+                match = DATE_IN_TITLE_RE.search(event_data['title'])
                 if match:
                     day = int(match.group(1))
                     month = int(match.group(2))
-                    from datetime import datetime
-                    current_year = datetime.now().year
-                    current_month = datetime.now().month
                     # If month has passed, use next year
-                    if month < current_month:
-                        year = current_year + 1
+                    if month < self._now.month:
+                        year = self._now.year + 1
                     else:
-                        year = current_year
+                        year = self._now.year
                     try:
                         event_data['date'] = f"{year:04d}-{month:02d}-{day:02d}"
                     except:
@@ -207,7 +207,7 @@ class PratersaunaScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
     
     def _extract_title_from_url(self, url: str) -> Optional[str]:
@@ -220,7 +220,7 @@ class PratersaunaScraper(BaseVenueScraper):
         
         try:
             # Extract path after /event/
-            match = re.search(r'/event/([^/]+)', url)
+            match = EVENT_SLUG_RE.search(url)
             if match:
                 slug = match.group(1)
                 # Convert slug to title: replace hyphens with spaces, capitalize
@@ -231,37 +231,23 @@ class PratersaunaScraper(BaseVenueScraper):
                     return title
         except (AttributeError, ValueError, TypeError) as e:
             if self.debug:
-                self.log(f"Error extracting title from URL '{url}': {e}", "error")
+                self.log(f"Error extracting title from URL '{url}': {e}", level="error")
         
         return None
     
-    def _enrich_from_detail_page(self, event_data: Dict):
-        """Enrich event data from detail page"""
-        if not event_data.get('detail_url'):
+    def _enrich_from_detail_page(self, event_data: Dict, soup):
+        """Enrich event data from its pre-fetched detail page"""
+        if not soup:
             return
         
         try:
-            if self.debug:
-                self.log(f"  Fetching detail page: {event_data['detail_url']}", "debug")
-            
-            soup = self.fetch_page(event_data['detail_url'])
-            if not soup:
-                return
+            self.log("  Enriching from detail page: %s", event_data['detail_url'], level="debug")
             
             # Extract full description
-            desc_selectors = [
-                'div.entry-content p',
-                '.event-description',
-                '.wp-block-paragraph'
-            ]
-            
+            # Paragraphs of the first selector that yields usable text
             desc_parts = []
-            for sel in desc_selectors:
-                for elem in soup.select(sel):
-                    text = elem.get_text(strip=True)
-                    if text and len(text) > 10:
-                        desc_parts.append(text)
-                
+            for _, elems in DETAIL_DESC_SELECTORS.iter_groups(soup):
+                desc_parts = [text for text in (elem.get_text(strip=True) for elem in elems) if len(text) > 10]
                 if desc_parts:
                     break
             
@@ -269,46 +255,34 @@ class PratersaunaScraper(BaseVenueScraper):
                 event_data['description'] = '\n\n'.join(desc_parts)
             
             # Extract ticket link
-            ticket_selectors = [
-                'a[href*="ticket"]',
-                'a.button',
-                'a.wp-block-button__link'
-            ]
-            for sel in ticket_selectors:
-                ticket_elem = soup.select_one(sel)
-                if ticket_elem and ticket_elem.get('href'):
+            for ticket_elem in TICKET_SELECTORS.iter_first(soup):
+                if ticket_elem.get('href'):
                     event_data['ticket_url'] = ticket_elem['href']
                     break
             
             # Extract lineup/artists
             lineup_elem = soup.select_one('div.lineup, .artists')
             if lineup_elem:
-                lineup_text = lineup_elem.get_text()
-                # Extract capitalized words as artist names
-                artists = re.findall(r'\b[A-Z][A-Za-z\s&]{2,30}\b', lineup_text)
-                event_data['artists'] = list(set(artists))[:10]
-            
-            # Extract time if not found yet
-            if not event_data.get('time'):
-                page_text = soup.get_text()
-                event_data['time'] = self.parse_time(page_text)
+                event_data['artists'] = extract_artists(lineup_elem.get_text())
             
-            # Extract date if not found yet
-            if not event_data.get('date'):
-                page_text = soup.get_text()
-                event_data['date'] = self.parse_german_date(page_text)
+            # Extract time and date if not found yet, from the main content region's
+            # text (built at most once) instead of the whole document
+            if not (event_data.get('time') and event_data.get('date')):
+                page_text = (DETAIL_TEXT_SEL.select_one(soup) or soup).get_text(' ')
+                if not event_data.get('time'):
+                    event_data['time'] = self.parse_time(page_text)
+                if not event_data.get('date'):
+                    event_data['date'] = self.parse_german_date(page_text)
             
         except Exception as e:
             if self.debug:
-                self.log(f"  Error enriching from detail page: {e}", "warning")
+                self.log(f"  Error enriching from detail page: {e}", level="warning")
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Pratersauna events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = PratersaunaScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
@@ -5,19 +5,18 @@ Extracts upcoming events from https://praterstrasse.wien/en/praterstrasse-ticket
 and saves them to the Supabase database.
 
 Usage:
-    python website-scrapers/praterstrasse.py [--dry-run] [--debug]
+    python website-scrapers/praterstrasse.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
 import os
-import re
 from typing import List, Dict, Optional
 import argparse
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, element_text, extract_artists, parse_scraper_args
 
 
 class PraterstrasseScraper(BaseVenueScraper):
@@ -53,26 +52,30 @@ class PraterstrasseScraper(BaseVenueScraper):
             items = soup.select(selector)
             if items:
                 event_items = items
-                self.log(f"Found {len(items)} items using selector: {selector}", "debug" if self.debug else "info")
+                self.log(f"Found {len(items)} items using selector: {selector}", level="debug" if self.debug else "info")
                 break
         
         self.log(f"Found {len(event_items)} potential events")
         
         for idx, item in enumerate(event_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item)
             
             if event_data and event_data.get('title'):
-                # Visit detail page if available
-                if event_data.get('detail_url'):
-                    self._enrich_from_detail_page(event_data)
-                
                 events.append(event_data)
-                status = "✓" if event_data.get('date') else "?"
-                self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+        
+        # Visit detail pages concurrently instead of one round trip per event
+        detailed = [event for event in events if event.get('detail_url')]
+        soups = self.fetch_pages([event['detail_url'] for event in detailed])
+        for event_data, detail_soup in zip(detailed, soups):
+            self._enrich_from_detail_page(event_data, detail_soup)
+        
+        for event_data in events:
+            status = "✓" if event_data.get('date') else "?"
+            self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
+                    level="success" if status == "✓" else "warning")
         
         return events
     
@@ -96,32 +99,27 @@ class PraterstrasseScraper(BaseVenueScraper):
             for sel in title_selectors:
                 title_elem = item.select_one(sel)
                 if title_elem:
-                    event_data['title'] = title_elem.get_text(strip=True)
+                    event_data['title'] = element_text(title_elem)
                     break
             
             # Extract link
             link_elem = item.select_one('a[href*="/event/"]') or item.find('a', href=True)
             if link_elem and link_elem.get('href'):
-                href = link_elem['href']
-                if not href.startswith('http'):
-                    href = self.BASE_URL.rstrip('/') + '/' + href.lstrip('/')
-                event_data['detail_url'] = href
+                event_data['detail_url'] = self.absolute_url(link_elem['href'])
             
             # Extract image
-            img_elem = item.select_one('img')
+            img_elem = item.find('img', src=True) or item.find('img', attrs={'data-src': True})
             if img_elem:
                 src = img_elem.get('src') or img_elem.get('data-src')
                 if src:
-                    if not src.startswith('http'):
-                        src = self.BASE_URL.rstrip('/') + '/' + src.lstrip('/')
-                    event_data['image_url'] = src
+                    event_data['image_url'] = self.absolute_url(src)
             
             # Extract date
             date_selectors = ['time', '.event-date']
             for sel in date_selectors:
                 date_elem = item.select_one(sel)
                 if date_elem:
-                    date_text = date_elem.get_text(strip=True)
+                    date_text = element_text(date_elem)
                     parsed_date = self.parse_german_date(date_text)
                     if parsed_date:
                         event_data['date'] = parsed_date
@@ -130,51 +128,43 @@ class PraterstrasseScraper(BaseVenueScraper):
             # Extract time
             time_elem = item.select_one('span.time, .event-time')
             if time_elem:
-                time_text = time_elem.get_text(strip=True)
+                time_text = element_text(time_elem)
                 event_data['time'] = self.parse_time(time_text)
             
             # Extract event series (KLUBNACHT, GAZE, etc.)
             series_elem = item.select_one('.event-series')
             if series_elem:
-                series = series_elem.get_text(strip=True)
+                series = element_text(series_elem)
                 event_data['artists'] = [series]
             
             return event_data if event_data['title'] else None
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
     
-    def _enrich_from_detail_page(self, event_data: Dict):
-        """Enrich event data from detail page"""
-        if not event_data.get('detail_url'):
+    def _enrich_from_detail_page(self, event_data: Dict, soup):
+        """Enrich event data from its pre-fetched detail page"""
+        if not soup:
             return
         
         try:
             if self.debug:
-                self.log(f"  Fetching detail page: {event_data['detail_url']}", "debug")
-            
-            soup = self.fetch_page(event_data['detail_url'])
-            if not soup:
-                return
+                self.log(f"  Enriching from detail page: {event_data['detail_url']}", level="debug")
             
             # Extract description
-            desc_parts = []
-            for elem in soup.select('.event-description, .content p'):
-                text = elem.get_text(strip=True)
-                if text and len(text) > 10:
-                    desc_parts.append(text)
-            
+            desc_parts = [
+                text for text in (elem.get_text(strip=True) for elem in soup.select('.event-description, .content p'))
+                if len(text) > 10
+            ]
             if desc_parts:
                 event_data['description'] = '\n\n'.join(desc_parts)
             
             # Extract lineup
             lineup_elem = soup.select_one('.lineup')
             if lineup_elem:
-                lineup_text = lineup_elem.get_text()
-                artists = re.findall(r'\b[A-Z][A-Za-z\s&]{2,30}\b', lineup_text)
-                event_data['artists'] = list(set(artists))[:10]
+                event_data['artists'] = extract_artists(lineup_elem.get_text())
             
             # Extract ticket link
             ticket_elem = soup.select_one('a[href*="ticket"]')
@@ -188,15 +178,13 @@ class PraterstrasseScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"  Error enriching from detail page: {e}", "warning")
+                self.log(f"  Error enriching from detail page: {e}", level="warning")
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Praterstrasse events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = PraterstrasseScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
@@ -13,19 +13,45 @@ The page structure shows events as:
   - .event-price: price info
 
 Usage:
-    python website-scrapers/rhiz.py [--dry-run] [--debug]
+    python website-scrapers/rhiz.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
 import os
-import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import argparse
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
+import soupsieve as sv
+from bs4 import SoupStrainer
+from base_scraper import BaseVenueScraper, element_text, parse_scraper_args
 
-from base_scraper import BaseVenueScraper
+# Only the event grid items are parsed from the listing page
+EVENT_STRAINER = SoupStrainer(class_='grid-item')
+
+# Descendant selectors, compiled once instead of on every select_one() call
+DATE_LINK_SEL = sv.compile('.event-date a')
+TITLE_LINK_SEL = sv.compile('.ev-body h3 a')
+SUBTITLE_LINK_SEL = sv.compile('.ev-body h4 a')
+IMAGE_SEL = sv.compile('.event-image img')
+
+
+def parse_rhiz_date(date_text: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a Rhiz date label like "fr 051225 20:00" into ("2025-12-05", "20:00").
+    
+    The label is a fixed "[weekday] DDMMYY HH:MM" format, so it is tokenized
+    with split() and slicing instead of a regex.
+    """
+    parts = date_text.split()
+    for ddmmyy, clock in zip(parts, parts[1:]):
+        if len(ddmmyy) != 6 or not ddmmyy.isdigit():
+            continue
+        hour, sep, minute = clock.partition(':')
+        if sep and 1 <= len(hour) <= 2 and hour.isdigit() and minute[:2].isdigit() and len(minute) >= 2:
+            return f"20{ddmmyy[4:6]}-{ddmmyy[2:4]}-{ddmmyy[:2]}", f"{hour}:{minute[:2]}"
+    return None
 
 
 class RhizScraper(BaseVenueScraper):
@@ -42,28 +68,34 @@ class RhizScraper(BaseVenueScraper):
         """Scrape events from Rhiz"""
         self.log(f"Fetching events from {self.EVENTS_URL}")
         
-        soup = self.fetch_page(self.EVENTS_URL)
+        soup = self.fetch_page(self.EVENTS_URL, parse_only=EVENT_STRAINER)
         if not soup:
             return []
         
         events = []
+        seen_urls = set()
         
         # Rhiz lists events in grid-item containers
-        event_items = soup.select('.grid-item')
+        event_items = soup.find_all(class_='grid-item')
         
         self.log(f"Found {len(event_items)} events")
         
         for idx, item in enumerate(event_items[:50], 1):  # Limit to 50
-            if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+            self.log("Processing event %d/%d", idx, len(event_items), level="debug")
             
             event_data = self._parse_event_item(item)
             
             if event_data and event_data.get('title'):
+                # An event shown in several grid items links to the same detail page
+                detail_url = event_data.get('detail_url')
+                if detail_url:
+                    if detail_url in seen_urls:
+                        continue
+                    seen_urls.add(detail_url)
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
-                self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                self.log("  %s %.50s - %s", status, event_data['title'], event_data.get('date', 'no date'),
+                         level="success" if status == "✓" else "warning")
         
         return events
     
@@ -84,46 +116,44 @@ class RhizScraper(BaseVenueScraper):
             
             # Extract date and time from event-date link
             # Format: "sa 061225 19:30" (saturday 6 Dec 2025 at 19:30)
-            date_elem = item.select_one('.event-date a')
+            date_elem = DATE_LINK_SEL.select_one(item)
             if date_elem:
-                date_text = date_elem.get_text(strip=True)
+                date_text = element_text(date_elem)
                 # Parse: "fr 051225 20:00"
-                date_match = re.search(r'(\d{2})(\d{2})(\d{2})\s+(\d{1,2}:\d{2})', date_text)
-                if date_match:
-                    day, month, year, time = date_match.groups()
-                    event_data['date'] = f"20{year}-{month}-{day}"
-                    event_data['time'] = time
+                parsed = parse_rhiz_date(date_text)
+                if parsed:
+                    event_data['date'], event_data['time'] = parsed
                 
                 # Also get detail URL from this link
                 event_data['detail_url'] = date_elem.get('href')
             
             # Extract title from h3 a
-            title_elem = item.select_one('.ev-body h3 a')
+            title_elem = TITLE_LINK_SEL.select_one(item)
             if title_elem:
-                event_data['title'] = title_elem.get_text(strip=True)
+                event_data['title'] = element_text(title_elem)
                 if not event_data.get('detail_url'):
                     event_data['detail_url'] = title_elem.get('href')
             
             # Extract subtitle from h4 a
-            subtitle_elem = item.select_one('.ev-body h4 a')
+            subtitle_elem = SUBTITLE_LINK_SEL.select_one(item)
             if subtitle_elem:
-                subtitle = subtitle_elem.get_text(strip=True)
+                subtitle = element_text(subtitle_elem)
                 if subtitle:
                     event_data['description'] = subtitle
             
             # Extract category (Live, DJ, etc.)
-            category_elem = item.select_one('.event-category')
+            category_elem = item.find(class_='event-category')
             if category_elem:
-                category = category_elem.get_text(strip=True)
+                category = element_text(category_elem)
                 event_data['artists'] = [category]
             
             # Extract price
-            price_elem = item.select_one('.event-price')
+            price_elem = item.find(class_='event-price')
             if price_elem:
-                event_data['price'] = price_elem.get_text(strip=True)
+                event_data['price'] = element_text(price_elem)
             
             # Extract image
-            img_elem = item.select_one('.event-image img')
+            img_elem = IMAGE_SEL.select_one(item)
             if img_elem:
                 # Try data-src first (lazy loading), then src
                 src = img_elem.get('data-src') or img_elem.get('src')
@@ -139,16 +169,14 @@ class RhizScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Rhiz events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = RhizScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
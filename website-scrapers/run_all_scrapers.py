@@ -1,68 +1,130 @@
 #!/usr/bin/env python3
 """
-Run all configured venue scrapers sequentially.
+Run all configured venue scrapers, several venues at a time.
 
 Usage:
-    python website-scrapers/run_all_scrapers.py [--dry-run] [--debug]
+    python website-scrapers/run_all_scrapers.py [--dry-run] [--debug] [--no-cache] [--workers N]
 """
 
 import sys
 import os
 import argparse
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
+from base_scraper import close_http_caches, parse_scraper_args
 from generic_scraper import GenericVenueScraper
 from venue_configs import get_venue_config, list_venues
 
-
-# Import dedicated scrapers
+# Venues scraped at the same time - scrapers spend most of their time waiting on
+# HTTP (which releases the GIL), so threads are enough
+DEFAULT_WORKERS = 4
+
+# Serializes the runner's own output blocks between worker threads
+PRINT_LOCK = threading.Lock()
+
+
+# Dedicated scraper modules: venue key -> (module name, class name)
+SCRAPER_MODULES = {
+    'grelle-forelle': ('grelle-forelle', 'GrelleForelleScraper'),
+    'flex': ('flex', 'FlexScraper'),
+    'pratersauna': ('pratersauna', 'PratersaunaScraper'),
+    'das-werk': ('das-werk', 'DasWerkScraper'),
+    'u4': ('u4', 'U4Scraper'),
+    'o-der-klub': ('o-klub', 'OKlubScraper'),
+    'volksgarten': ('volksgarten', 'VolksgartenScraper'),
+    'flucc': ('flucc-wanne', 'FluccWanneScraper'),
+    'camera-club': ('camera-club', 'CameraClubScraper'),
+    'chelsea': ('chelsea', 'ChelseaScraper'),
+    'celeste': ('celeste', 'CelesteScraper'),
+    'donau': ('donau', 'DonauScraper'),
+    'the-loft': ('the-loft', 'TheLoftScraper'),
+    'rhiz': ('rhiz', 'RhizScraper'),
+    'praterstrasse': ('praterstrasse', 'PraterstrasseScraper'),
+    'prater-dome': ('praterdome', 'PraterdomeScraper'),
+    'sass-music-club': ('sass', 'SassScraper'),
+    'ponyhof': ('ponyhof', 'PonyhofScraper'),
+    'vieipee': ('vieipee', 'VieipeeScraper'),
+    'babenberger-passage': ('babenberger-passage', 'BabenbergerPassageScraper'),
+    'patroc-wien-gay': ('patroc-wien', 'PatrocWienGayScraper'),
+    'ibiza-spotlight': ('ibiza-spotlight', 'IbizaSpotlightScraper'),
+}
+
+
+@lru_cache(maxsize=None)
 def import_scraper(venue_key):
-    """Import dedicated scraper for a venue if it exists"""
-    scraper_map = {
-        'grelle-forelle': ('grelle-forelle', 'GrelleForelleScraper'),
-        'flex': ('flex', 'FlexScraper'),
-        'pratersauna': ('pratersauna', 'PratersaunaScraper'),
-        'das-werk': ('das-werk', 'DasWerkScraper'),
-        'u4': ('u4', 'U4Scraper'),
-        'o-der-klub': ('o-klub', 'OKlubScraper'),
-        'volksgarten': ('volksgarten', 'VolksgartenScraper'),
-        'flucc': ('flucc-wanne', 'FluccWanneScraper'),
-        'camera-club': ('camera-club', 'CameraClubScraper'),
-        'chelsea': ('chelsea', 'ChelseaScraper'),
-        'celeste': ('celeste', 'CelesteScraper'),
-        'donau': ('donau', 'DonauScraper'),
-        'the-loft': ('the-loft', 'TheLoftScraper'),
-        'rhiz': ('rhiz', 'RhizScraper'),
-        'praterstrasse': ('praterstrasse', 'PraterstrasseScraper'),
-        'prater-dome': ('praterdome', 'PraterdomeScraper'),
-        'sass-music-club': ('sass', 'SassScraper'),
-        'ponyhof': ('ponyhof', 'PonyhofScraper'),
-        'vieipee': ('vieipee', 'VieipeeScraper'),
-        'babenberger-passage': ('babenberger-passage', 'BabenbergerPassageScraper'),
-        'patroc-wien-gay': ('patroc-wien', 'PatrocWienGayScraper'),
-        'ibiza-spotlight': ('ibiza-spotlight', 'IbizaSpotlightScraper'),
-    }
+    """
+    Import dedicated scraper for a venue if it exists.
     
-    if venue_key in scraper_map:
-        module_name, class_name = scraper_map[venue_key]
-        try:
-            module = __import__(module_name)
-            return getattr(module, class_name)
-        except (ImportError, AttributeError) as e:
-            print(f"⚠️  Could not import dedicated scraper for {venue_key}: {e}")
-            return None
+    Modules are only imported for venues that are actually run, and the result
+    (including a failed import) is cached for the rest of the process.
+    """
+    if venue_key not in SCRAPER_MODULES:
+        return None
     
-    return None
+    module_name, class_name = SCRAPER_MODULES[venue_key]
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError) as e:
+        write_lines([f"⚠️  Could not import dedicated scraper for {venue_key}: {e}"])
+        return None
+
+
+def write_lines(lines):
+    """Write several lines of runner output as one block, so worker threads don't interleave them"""
+    with PRINT_LOCK:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def run_venue(venue_key, debug=False):
+    """Run the scraper for one venue and return its result dict"""
+    # The runner's lines for this venue are written in one block with the first message
+    lines = ['', '=' * 70, f"Venue: {venue_key}", '=' * 70]
+    
+    config = get_venue_config(venue_key)
+    if not config:
+        write_lines(lines + [f"❌ Unknown venue: {venue_key}"])
+        return {'success': False, 'error': 'Unknown venue'}
+
+    # Skip venues where scraping is disabled (e.g., closed venues)
+    if config.get('scraping_enabled') is False:
+        write_lines(lines + [f"⚠️ Skipping {venue_key}: scraping disabled (venue {config.get('status', 'inactive')})"])
+        return {
+            'success': False,
+            'error': 'Scraping disabled',
+            'skipped': True,
+        }
+
+    try:
+        # Try to use dedicated scraper first
+        ScraperClass = import_scraper(venue_key)
+
+        if ScraperClass:
+            write_lines(lines + [f"ℹ Using dedicated scraper for {venue_key}"])
+            scraper = ScraperClass(dry_run=False, debug=debug)
+        else:
+            write_lines(lines + [f"ℹ Using generic scraper for {venue_key}"])
+            scraper = GenericVenueScraper(config, dry_run=False, debug=debug)
+        
+        # Events are linked to venues in one pass after all venues are saved (see main)
+        scraper.link_after_save = False
+        return scraper.run()
+    except Exception as e:
+        write_lines([f"❌ Error running scraper for {venue_key}: {e}"])
+        return {'success': False, 'error': str(e)}
 
 
 def main():
     parser = argparse.ArgumentParser(description='Run all venue scrapers')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
     parser.add_argument('--venues', nargs='+', help='Specific venues to scrape (default: all)')
-    args = parser.parse_args()
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Venues scraped concurrently (default: {DEFAULT_WORKERS}, 1 = sequential)')
+    args = parse_scraper_args(parser)
     
     # Get venues to scrape
     if args.venues:
@@ -74,48 +136,23 @@ def main():
     print(f"Running scrapers for {len(venues_to_scrape)} venues")
     print("=" * 70)
     
-    results = {}
-    
-    for venue_key in venues_to_scrape:
-        print(f"\n{'=' * 70}")
-        print(f"Venue: {venue_key}")
-        print('=' * 70)
-        
-        config = get_venue_config(venue_key)
-        if not config:
-            print(f"❌ Unknown venue: {venue_key}")
-            results[venue_key] = {'success': False, 'error': 'Unknown venue'}
-            continue
-
-        # Skip venues where scraping is disabled (e.g., closed venues)
-        if config.get('scraping_enabled') is False:
-            print(f"⚠️ Skipping {venue_key}: scraping disabled (venue {config.get('status', 'inactive')})")
-            results[venue_key] = {
-                'success': False,
-                'error': 'Scraping disabled',
-                'skipped': True,
-            }
-            continue
-
-        try:
-            # Try to use dedicated scraper first
-            ScraperClass = import_scraper(venue_key)
-
-            if ScraperClass:
-                print(f"ℹ Using dedicated scraper for {venue_key}")
-                scraper = ScraperClass(dry_run=False, debug=args.debug)
-            else:
-                print(f"ℹ Using generic scraper for {venue_key}")
-                scraper = GenericVenueScraper(config, dry_run=False, debug=args.debug)
-
-            result = scraper.run()
-            results[venue_key] = result
-        except Exception as e:
-            print(f"❌ Error running scraper for {venue_key}: {e}")
-            results[venue_key] = {'success': False, 'error': str(e)}
-
-   
-
+    # Collect results as venues finish; the summary below keeps the requested order
+    completed = {}
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = {
+            executor.submit(run_venue, venue_key, args.debug): venue_key
+            for venue_key in venues_to_scrape
+        }
+        for future in as_completed(futures):
+            venue_key = futures[future]
+            try:
+                completed[venue_key] = future.result()
+            except Exception as e:
+                completed[venue_key] = {'success': False, 'error': str(e)}
+            with PRINT_LOCK:
+                print(f"⏱  Finished {venue_key} ({len(completed)}/{len(futures)})")
+    close_http_caches()
+    results = {venue_key: completed[venue_key] for venue_key in venues_to_scrape}
     
     # Print summary
     print(f"\n{'=' * 70}")
@@ -153,7 +190,7 @@ def main():
         print(f"  Skipped:       {skipped}")
     print('=' * 70)
     
-    # Link events to venues if not in dry-run mode
+    # Link events to venues once for all scrapers, if not in dry-run mode
     if not args.dry_run and total_inserted > 0:
         print(f"\n{'=' * 70}")
         print("Linking events to venues...")
@@ -5,19 +5,44 @@ Extracts upcoming events from https://sassvienna.com/de/programm
 and saves them to the Supabase database.
 
 Usage:
-    python website-scrapers/sass.py [--dry-run] [--debug]
+    python website-scrapers/sass.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
 import os
-import re
 from typing import List, Dict, Optional
 import argparse
+from itertools import islice
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
+import soupsieve as sv
+from bs4 import SoupStrainer
+from base_scraper import BaseVenueScraper, PrioritySelector, TICKET_KEYWORDS, TICKET_LINK_SEL, element_text, parse_scraper_args
 
-from base_scraper import BaseVenueScraper
+# Only the programme container is parsed from the listing page, not the navigation and footer
+EVENTS_STRAINER = SoupStrainer('div', class_='events')
+
+# Descendant selectors, compiled once instead of on every select()/select_one() call
+EVENT_ITEM_SEL = sv.compile('div.events div.event')
+TITLE_SEL = sv.compile('div.title h3')
+SUBLINE_SEL = sv.compile('div.subline h4')
+DESC_SEL = sv.compile('.event-description, .content p, article p')
+INSTAGRAM_LINK_SEL = sv.compile('a[href*="instagram.com"]')
+
+# Ticket links are matched by href first (TICKET_LINK_SEL); link text is only checked inside the article
+ARTICLE_LINK_SEL = sv.compile('article a[href]')
+
+# Paragraphs kept for the detail page description
+MAX_DESC_PARTS = 5
+
+# Detail page image, most specific selector first
+IMG_SELECTORS = PrioritySelector(
+    'img.event-image',
+    'div.header-image img',
+    'article img',
+    'img[src*="wp-content"]',
+)
 
 
 class SassScraper(BaseVenueScraper):
@@ -34,32 +59,36 @@ class SassScraper(BaseVenueScraper):
         """Scrape events from SASS Music Club"""
         self.log(f"Fetching events from {self.EVENTS_URL}")
         
-        soup = self.fetch_page(self.EVENTS_URL)
+        soup = self.fetch_page(self.EVENTS_URL, parse_only=EVENTS_STRAINER)
         if not soup:
             return []
         
         events = []
         
         # SASS has a specific structure: div.events contains div.event items
-        event_items = soup.select('div.events div.event')
+        event_items = EVENT_ITEM_SEL.select(soup)
         
         self.log(f"Found {len(event_items)} potential events")
         
         for idx, item in enumerate(event_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item)
             
             if event_data and event_data.get('title'):
-                # Visit detail page if available
-                if event_data.get('detail_url'):
-                    self._enrich_from_detail_page(event_data)
-                
                 events.append(event_data)
-                status = "✓" if event_data.get('date') else "?"
-                self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+        
+        # Visit detail pages concurrently instead of one round trip per event
+        detailed = [event for event in events if event.get('detail_url')]
+        soups = self.fetch_pages([event['detail_url'] for event in detailed])
+        for event_data, detail_soup in zip(detailed, soups):
+            self._enrich_from_detail_page(event_data, detail_soup)
+        
+        for event_data in events:
+            status = "✓" if event_data.get('date') else "?"
+            self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
+                    level="success" if status == "✓" else "warning")
         
         return events
     
@@ -79,46 +108,44 @@ class SassScraper(BaseVenueScraper):
             }
             
             # Extract title from h3 in div.title
-            title_elem = item.select_one('div.title h3')
+            title_elem = TITLE_SEL.select_one(item)
             if title_elem:
-                event_data['title'] = title_elem.get_text(strip=True)
+                event_data['title'] = element_text(title_elem)
             
             # Extract subtitle/subline if available
-            subline_elem = item.select_one('div.subline h4')
+            subline_elem = SUBLINE_SEL.select_one(item)
             if subline_elem:
-                subline = subline_elem.get_text(strip=True)
+                subline = element_text(subline_elem)
                 if subline:
                     event_data['title'] = f"{event_data['title']} {subline}"
             
             # Extract link from a.eventlink
-            link_elem = item.select_one('a.eventlink')
+            link_elem = item.find('a', class_='eventlink')
             if link_elem and link_elem.get('href'):
                 href = link_elem['href']
                 if not href.startswith('http'):
                     href = self.BASE_URL.rstrip('/') + href
                 event_data['detail_url'] = href
             
-            # Extract date from span.start_date (format: "27. Nov")
-            date_elem = item.select_one('span.start_date')
+            # Extract date from span.start_date (format: "27. Nov").
+            # parse_german_date() maps abbreviated month names itself (GERMAN_MONTHS)
+            date_elem = item.find('span', class_='start_date')
             if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                # Convert "Nov" to "November" for better parsing
-                date_text = date_text.replace('Nov', 'November').replace('Dez', 'Dezember').replace('Okt', 'Oktober')
-                event_data['date'] = self.parse_german_date(date_text)
+                event_data['date'] = self.parse_german_date(element_text(date_elem))
             
             # Extract time from span.start_time
-            time_elem = item.select_one('span.start_time')
+            time_elem = item.find('span', class_='start_time')
             if time_elem:
-                time_text = time_elem.get_text(strip=True)
+                time_text = element_text(time_elem)
                 event_data['time'] = self.parse_time(time_text)
             
             # Extract lineup (DJ names with Instagram handles)
-            lineup_elem = item.select_one('div.lineup')
+            lineup_elem = item.find('div', class_='lineup')
             if lineup_elem:
                 # Get all strong elements (artist names)
                 artists = []
                 for strong in lineup_elem.find_all('strong'):
-                    artist = strong.get_text(strip=True)
+                    artist = element_text(strong)
                     if artist:
                         artists.append(artist)
                 
@@ -131,87 +158,75 @@ class SassScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
     
-    def _enrich_from_detail_page(self, event_data: Dict):
-        """Enrich event data from detail page"""
-        if not event_data.get('detail_url'):
+    def _enrich_from_detail_page(self, event_data: Dict, soup):
+        """Enrich event data from its pre-fetched detail page"""
+        if not soup:
             return
         
         try:
             if self.debug:
-                self.log(f"  Fetching detail page: {event_data['detail_url']}", "debug")
-            
-            soup = self.fetch_page(event_data['detail_url'])
-            if not soup:
-                return
+                self.log(f"  Enriching from detail page: {event_data['detail_url']}", level="debug")
             
-            # Extract full description
-            desc_parts = []
-            for elem in soup.select('.event-description, .content p, article p'):
-                text = elem.get_text(strip=True)
-                if text and len(text) > 20:
-                    desc_parts.append(text)
+            # Extract full description from the first paragraphs; iselect() walks the
+            # tree lazily, so matching stops once enough text is collected
+            desc_parts = list(islice(
+                (text for text in (elem.get_text(strip=True) for elem in DESC_SEL.iselect(soup))
+                 if len(text) > 20),
+                MAX_DESC_PARTS,
+            ))
             
             if desc_parts:
-                full_desc = '\n\n'.join(desc_parts[:5])
+                full_desc = '\n\n'.join(desc_parts)
                 if event_data.get('description'):
                     event_data['description'] = f"{event_data['description']}\n\n{full_desc}"
                 else:
                     event_data['description'] = full_desc
                 
                 if self.debug:
-                    self.log(f"  ✓ Description: {len(full_desc)} chars", "debug")
+                    self.log(f"  ✓ Description: {len(full_desc)} chars", level="debug")
             
             # Extract image
-            img_selectors = [
-                'img.event-image',
-                'div.header-image img',
-                'article img',
-                'img[src*="wp-content"]'
-            ]
-            for sel in img_selectors:
-                img_elem = soup.select_one(sel)
-                if img_elem:
-                    src = img_elem.get('src') or img_elem.get('data-src')
-                    if src and 'logo' not in src.lower():
-                        if not src.startswith('http'):
-                            src = self.BASE_URL.rstrip('/') + '/' + src.lstrip('/')
-                        event_data['image_url'] = src
-                        if self.debug:
-                            self.log(f"  ✓ Image: {src[:50]}...", "debug")
-                        break
-            
-            # Extract ticket link
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                text = link.get_text().lower()
-                if any(kw in href.lower() or kw in text for kw in ['ticket', 'karte', 'buy', 'kaufen']):
-                    event_data['ticket_url'] = href
+            for img_elem in IMG_SELECTORS.iter_first(soup):
+                src = img_elem.get('src') or img_elem.get('data-src')
+                if src and 'logo' not in src.lower():
+                    if not src.startswith('http'):
+                        src = self.BASE_URL.rstrip('/') + '/' + src.lstrip('/')
+                    event_data['image_url'] = src
                     if self.debug:
-                        self.log(f"  ✓ Ticket URL: {href[:50]}...", "debug")
+                        self.log(f"  ✓ Image: {src[:50]}...", level="debug")
                     break
             
-            # Extract DJ Instagram handles
-            social_links = []
-            for link in soup.select('a[href*="instagram.com"]'):
-                social_links.append(link['href'])
+            # Extract ticket link
+            ticket_elem = TICKET_LINK_SEL.select_one(soup) or next(
+                (link for link in ARTICLE_LINK_SEL.select(soup)
+                 if any(kw in link.get_text().lower() for kw in TICKET_KEYWORDS)),
+                None,
+            )
+            if ticket_elem:
+                href = ticket_elem['href']
+                event_data['ticket_url'] = href
+                if self.debug:
+                    self.log(f"  ✓ Ticket URL: {href[:50]}...", level="debug")
             
-            if social_links and self.debug:
-                self.log(f"  ✓ Found {len(social_links)} Instagram links", "debug")
+            # DJ Instagram handles are only reported in debug output, so the
+            # extra pass over the page's anchors is skipped otherwise
+            if self.debug:
+                social_links = INSTAGRAM_LINK_SEL.select(soup)
+                if social_links:
+                    self.log(f"  ✓ Found {len(social_links)} Instagram links", level="debug")
             
         except Exception as e:
             if self.debug:
-                self.log(f"  Error enriching from detail page: {e}", "warning")
+                self.log(f"  Error enriching from detail page: {e}", level="warning")
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape SASS Music Club events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = SassScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
@@ -19,7 +19,21 @@ from typing import List, Dict, Optional
 import argparse
 
 sys.path.insert(0, os.path.dirname(__file__))
-from base_scraper import BaseVenueScraper
+import soupsieve as sv
+from bs4 import SoupStrainer
+from base_scraper import BaseVenueScraper, parse_scraper_args
+
+# Events are links wrapping a div.box-wrap, so only links are parsed from the programme page
+LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Compiled once instead of on every select() call
+EVENT_LINK_SEL = sv.compile('a:has(div.box-wrap)')
+
+# Date in div.datum, e.g. "Di. 9.12.2025"
+DATE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+
+# "Eintritt: " prefix of the price in span.preis
+PRICE_PREFIX_RE = re.compile(r'^Eintritt:\s*')
 
 
 class TheLoftScraper(BaseVenueScraper):
@@ -36,20 +50,20 @@ class TheLoftScraper(BaseVenueScraper):
         """Scrape events from The Loft"""
         self.log(f"Fetching events from {self.EVENTS_URL}")
         
-        soup = self.fetch_page(self.EVENTS_URL)
+        soup = self.fetch_page(self.EVENTS_URL, parse_only=LINK_STRAINER)
         if not soup:
             return []
         
         events = []
         
         # Find all event links with box-wrap structure
-        event_links = soup.select('a:has(div.box-wrap)')
+        event_links = EVENT_LINK_SEL.select(soup)
         
         self.log(f"Found {len(event_links)} events")
         
         for idx, link in enumerate(event_links[:50], 1):  # Limit to 50
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_links)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_links)}", level="debug")
             
             event_data = self._parse_event_link(link)
             
@@ -57,7 +71,7 @@ class TheLoftScraper(BaseVenueScraper):
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
                 self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                        level="success" if status == "✓" else "warning")
         
         return events
     
@@ -84,40 +98,40 @@ class TheLoftScraper(BaseVenueScraper):
                 event_data['detail_url'] = href
             
             # Get the box-wrap div
-            box = link.select_one('div.box-wrap')
+            box = link.find('div', class_='box-wrap')
             if not box:
                 return None
             
             # Extract title from content-middle
-            title_elem = box.select_one('div.content-middle')
+            title_elem = box.find('div', class_='content-middle')
             if title_elem:
                 event_data['title'] = title_elem.get_text(strip=True)
             
             # Extract date from datum (format: "Di. 9.12.2025")
-            date_elem = box.select_one('div.datum')
+            date_elem = box.find('div', class_='datum')
             if date_elem:
                 date_text = date_elem.get_text(strip=True)
                 # Parse date: "Di. 9.12.2025" or "Fr. 12.12.2025"
-                date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', date_text)
+                date_match = DATE_RE.search(date_text)
                 if date_match:
                     day, month, year = date_match.groups()
                     event_data['date'] = f"{year}-{int(month):02d}-{int(day):02d}"
             
             # Extract time from open span
-            time_elem = box.select_one('span.open')
+            time_elem = box.find('span', class_='open')
             if time_elem:
                 event_data['time'] = time_elem.get_text(strip=True)
             
             # Extract price from preis span
-            price_elem = box.select_one('span.preis')
+            price_elem = box.find('span', class_='preis')
             if price_elem:
                 price_text = price_elem.get_text(strip=True)
                 # Remove "Eintritt: " prefix
-                price_text = re.sub(r'^Eintritt:\s*', '', price_text)
+                price_text = PRICE_PREFIX_RE.sub('', price_text)
                 event_data['price'] = price_text
             
             # Extract room/location from content-right
-            room_elem = box.select_one('div.content-right')
+            room_elem = box.find('div', class_='content-right')
             if room_elem:
                 room = room_elem.get_text(strip=True)
                 event_data['artists'] = [f"The Loft {room}"]
@@ -127,16 +141,14 @@ class TheLoftScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event link: {e}", "error")
+                self.log(f"Error parsing event link: {e}", level="error")
             return None
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape The Loft events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = TheLoftScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
@@ -16,7 +16,9 @@ from datetime import datetime
 import time
 
 sys.path.insert(0, os.path.dirname(__file__))
-from base_scraper import BaseVenueScraper
+import soupsieve as sv
+from bs4 import SoupStrainer
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 # Selenium imports
 from selenium import webdriver
@@ -26,7 +28,16 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
-from bs4 import BeautifulSoup
+
+# Only the EventON event items of the rendered page are parsed
+EVENT_STRAINER = SoupStrainer(class_='eventon_list_event')
+
+# Selectors without a find() equivalent, compiled once instead of per event
+FEATURED_IMG_SEL = sv.compile('.ev_ftImg img')
+EVENT_LINK_SEL = sv.compile('a[href*="/events/"]')
+
+# itemprop startDate, e.g. "2025-12-4T23:00+1:00"
+START_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{2})')
 
 
 class U4Scraper(BaseVenueScraper):
@@ -62,10 +73,10 @@ class U4Scraper(BaseVenueScraper):
             self.driver = webdriver.Chrome(service=service, options=options)
             self.wait = WebDriverWait(self.driver, 20)  # 20 Sekunden Timeout
             
-            self.log("✓ Selenium WebDriver initialized", "success")
+            self.log("✓ Selenium WebDriver initialized", level="success")
             return True
         except Exception as e:
-            self.log(f"✗ Failed to initialize Selenium: {e}", "error")
+            self.log(f"✗ Failed to initialize Selenium: {e}", level="error")
             return False
     
     def _close_selenium(self):
@@ -73,7 +84,7 @@ class U4Scraper(BaseVenueScraper):
         if self.driver:
             try:
                 self.driver.quit()
-                self.log("✓ WebDriver closed", "success")
+                self.log("✓ WebDriver closed", level="success")
             except:
                 pass
     
@@ -89,7 +100,7 @@ class U4Scraper(BaseVenueScraper):
             events = []
             
             # Load the page
-            self.log("📄 Loading page with Selenium...", "info")
+            self.log("📄 Loading page with Selenium...", level="info")
             self.driver.get(self.EVENTS_URL)
             
             # Wait for events to load via JavaScript
@@ -97,26 +108,26 @@ class U4Scraper(BaseVenueScraper):
                 self.wait.until(
                     EC.presence_of_all_elements_located((By.CLASS_NAME, "eventon_list_event"))
                 )
-                self.log("✓ Events rendered by JavaScript", "success")
+                self.log("✓ Events rendered by JavaScript", level="success")
             except TimeoutException:
-                self.log("✗ Events failed to load (timeout after 20s)", "error")
+                self.log("✗ Events failed to load (timeout after 20s)", level="error")
                 return []
             
             # Scroll to trigger lazy-loading of images
-            self.log("📸 Scrolling to load images...", "info")
+            self.log("📸 Scrolling to load images...", level="info")
             self._scroll_to_load_images()
             
             # Get rendered HTML
             html_content = self.driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = self.parse_html(html_content, parse_only=EVENT_STRAINER)
             
             # Parse events
-            event_items = soup.select('.eventon_list_event')
-            self.log(f"Found {len(event_items)} EventON event items", "info")
+            event_items = soup.find_all(class_='eventon_list_event')
+            self.log(f"Found {len(event_items)} EventON event items", level="info")
             
             for idx, item in enumerate(event_items[:50], 1):
                 if self.debug:
-                    self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                    self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
                 
                 event_data = self._parse_eventon_event(item)
                 
@@ -125,7 +136,7 @@ class U4Scraper(BaseVenueScraper):
                     status = "✓" if event_data.get('date') else "?"
                     self.log(
                         f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}",
-                        "success" if status == "✓" else "warning"
+                        level="success" if status == "✓" else "warning"
                     )
             
             return events
@@ -152,10 +163,10 @@ class U4Scraper(BaseVenueScraper):
             
             # Scroll back to top
             self.driver.execute_script("window.scrollTo(0, 0);")
-            self.log("✓ Page scrolled, lazy-loaded images loaded", "success")
+            self.log("✓ Page scrolled, lazy-loaded images loaded", level="success")
             
         except Exception as e:
-            self.log(f"⚠ Scrolling error (non-critical): {e}", "warning")
+            self.log(f"⚠ Scrolling error (non-critical): {e}", level="warning")
     
     def _parse_eventon_event(self, item) -> Optional[Dict]:
         """Parse a single EventON event item"""
@@ -173,28 +184,28 @@ class U4Scraper(BaseVenueScraper):
             }
             
             # Try to extract from schema.org JSON-LD first (most reliable)
-            schema_script = item.select_one('script[type="application/ld+json"]')
+            schema_script = item.find('script', type='application/ld+json')
             if schema_script:
                 try:
                     schema_data = json.loads(schema_script.string)
                     if schema_data.get('image'):
                         event_data['image_url'] = schema_data['image']
                     if schema_data.get('description'):
-                        # Clean HTML from description
-                        desc = re.sub(r'<[^>]+>', ' ', schema_data['description'])
-                        desc = re.sub(r'\s+', ' ', desc).strip()
-                        event_data['description'] = desc[:500]
+                        # Strip HTML from the description with the HTML parser (lxml when
+                        # installed), then collapse whitespace with split()
+                        desc_text = self.parse_html(schema_data['description']).get_text(' ')
+                        event_data['description'] = ' '.join(desc_text.split())[:500]
                 except json.JSONDecodeError:
                     if self.debug:
-                        self.log("JSON-LD parsing failed for event item", "warning")
+                        self.log("JSON-LD parsing failed for event item", level="warning")
             
             # Extract title from span.evcal_event_title
-            title_elem = item.select_one('span.evcal_event_title')
+            title_elem = item.find('span', class_='evcal_event_title')
             if title_elem:
                 event_data['title'] = title_elem.get_text(strip=True)
             
             # Extract image - CHECK BOTH src AND data-src FOR LAZY-LOADED IMAGES
-            ft_img = item.select_one('.ev_ftImg img')
+            ft_img = FEATURED_IMG_SEL.select_one(item)
             if ft_img:
                 # Try src first
                 img_url = ft_img.get('src')
@@ -206,17 +217,17 @@ class U4Scraper(BaseVenueScraper):
             
             # Fallback to meta itemprop image
             if not event_data.get('image_url'):
-                meta_img = item.select_one('meta[itemprop="image"]')
+                meta_img = item.find('meta', itemprop='image')
                 if meta_img:
                     event_data['image_url'] = meta_img.get('content')
             
             # Extract date from meta itemprop startDate
-            meta_start = item.select_one('meta[itemprop="startDate"]')
+            meta_start = item.find('meta', itemprop='startDate')
             if meta_start:
                 start_date = meta_start.get('content')
                 if start_date:
                     # Format: "2025-12-4T23:00+1:00"
-                    date_match = re.match(r'(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{2})', start_date)
+                    date_match = START_DATE_RE.match(start_date)
                     if date_match:
                         year, month, day, hour, minute = date_match.groups()
                         event_data['date'] = f"{year}-{int(month):02d}-{int(day):02d}"
@@ -224,11 +235,11 @@ class U4Scraper(BaseVenueScraper):
             
             # Fallback to parsing from date block
             if not event_data.get('date'):
-                date_block = item.select_one('.evoet_dayblock')
+                date_block = item.find(class_='evoet_dayblock')
                 if date_block:
-                    day_elem = date_block.select_one('em.date')
-                    month_elem = date_block.select_one('em.month')
-                    time_elem = date_block.select_one('em.time')
+                    day_elem = date_block.find('em', class_='date')
+                    month_elem = date_block.find('em', class_='month')
+                    time_elem = date_block.find('em', class_='time')
                     
                     if day_elem and month_elem:
                         day = day_elem.get_text(strip=True)
@@ -244,13 +255,13 @@ class U4Scraper(BaseVenueScraper):
                         event_data['time'] = self.parse_time(time_text)
             
             # Extract detail URL from itemprop url
-            url_link = item.select_one('a[itemprop="url"]')
+            url_link = item.find('a', itemprop='url')
             if url_link:
                 event_data['detail_url'] = url_link.get('href')
             
             # Fallback to first link to event page
             if not event_data.get('detail_url'):
-                event_link = item.select_one('a[href*="/events/"]')
+                event_link = EVENT_LINK_SEL.select_one(item)
                 if event_link:
                     href = event_link.get('href')
                     if href and not href.startswith('http'):
@@ -258,7 +269,7 @@ class U4Scraper(BaseVenueScraper):
                     event_data['detail_url'] = href
             
             # Extract subtitle as additional info
-            subtitle = item.select_one('span.evcal_event_subtitle')
+            subtitle = item.find('span', class_='evcal_event_subtitle')
             if subtitle:
                 event_data['artists'] = [subtitle.get_text(strip=True)]
             
@@ -266,7 +277,7 @@ class U4Scraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing EventON event: {e}", "error")
+                self.log(f"Error parsing EventON event: {e}", level="error")
             return None
     
     def _get_current_year(self):
@@ -277,9 +288,7 @@ class U4Scraper(BaseVenueScraper):
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape U4 events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = U4Scraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()
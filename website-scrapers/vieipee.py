@@ -2,7 +2,7 @@
 """Vieipee Event Scraper - https://vieipee.com"""
 import sys, os
 sys.path.insert(0, os.path.dirname(__file__))
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 from typing import List, Dict, Optional
 import argparse
 
@@ -28,7 +28,7 @@ class VieipeeScraper(BaseVenueScraper):
             data = self._parse_item(item)
             if data and data.get('title'):
                 events.append(data)
-                self.log(f"  ✓ {data['title'][:50]}", "success")
+                self.log(f"  ✓ {data['title'][:50]}", level="success")
         return events
     
     def _parse_item(self, item) -> Optional[Dict]:
@@ -60,9 +60,7 @@ class VieipeeScraper(BaseVenueScraper):
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('--dry-run', action='store_true')
-    parser.add_argument('--debug', action='store_true')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     scraper = VieipeeScraper(dry_run=args.dry_run, debug=args.debug)
     sys.exit(0 if scraper.run()['success'] else 1)
 
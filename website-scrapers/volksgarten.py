@@ -9,7 +9,7 @@ This scraper checks volksgarten.at for any event information but may find limite
 For complete event coverage, use the Facebook Events API or external event aggregators.
 
 Usage:
-    python website-scrapers/volksgarten.py [--dry-run] [--debug]
+    python website-scrapers/volksgarten.py [--dry-run] [--debug] [--no-cache]
 """
 
 import sys
@@ -21,7 +21,7 @@ import argparse
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from base_scraper import BaseVenueScraper
+from base_scraper import BaseVenueScraper, parse_scraper_args
 
 
 class VolksgartenScraper(BaseVenueScraper):
@@ -41,7 +41,7 @@ class VolksgartenScraper(BaseVenueScraper):
         the main website but may find limited or no events.
         """
         self.log(f"Fetching events from {self.EVENTS_URL}")
-        self.log("Note: Volksgarten posts events on Facebook - direct scraping limited", "warning")
+        self.log("Note: Volksgarten posts events on Facebook - direct scraping limited", level="warning")
         
         soup = self.fetch_page(self.EVENTS_URL)
         if not soup:
@@ -63,17 +63,17 @@ class VolksgartenScraper(BaseVenueScraper):
             items = soup.select(selector)
             if items:
                 event_items = items
-                self.log(f"Found {len(items)} items using selector: {selector}", "debug" if self.debug else "info")
+                self.log(f"Found {len(items)} items using selector: {selector}", level="debug" if self.debug else "info")
                 break
         
         self.log(f"Found {len(event_items)} potential events")
         
         if len(event_items) == 0:
-            self.log("Note: Volksgarten posts events mainly on social media (Facebook/Instagram)", "warning")
+            self.log("Note: Volksgarten posts events mainly on social media (Facebook/Instagram)", level="warning")
         
         for idx, item in enumerate(event_items, 1):
             if self.debug:
-                self.log(f"Processing event {idx}/{len(event_items)}", "debug")
+                self.log(f"Processing event {idx}/{len(event_items)}", level="debug")
             
             event_data = self._parse_event_item(item)
             
@@ -81,7 +81,7 @@ class VolksgartenScraper(BaseVenueScraper):
                 events.append(event_data)
                 status = "✓" if event_data.get('date') else "?"
                 self.log(f"  {status} {event_data['title'][:50]} - {event_data.get('date', 'no date')}", 
-                        "success" if status == "✓" else "warning")
+                        level="success" if status == "✓" else "warning")
         
         return events
     
@@ -153,16 +153,14 @@ class VolksgartenScraper(BaseVenueScraper):
             
         except Exception as e:
             if self.debug:
-                self.log(f"Error parsing event item: {e}", "error")
+                self.log(f"Error parsing event item: {e}", level="error")
             return None
 
 
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(description='Scrape Volksgarten events')
-    parser.add_argument('--dry-run', action='store_true', help='Run without saving to database')
-    parser.add_argument('--debug', action='store_true', help='Enable debug output')
-    args = parser.parse_args()
+    args = parse_scraper_args(parser)
     
     scraper = VolksgartenScraper(dry_run=args.dry_run, debug=args.debug)
     result = scraper.run()